@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+NodeHexa Web 页面嵌入脚本
+将 data/ 目录下的网页 gzip 压缩后生成 PROGMEM C 头文件，
+供固件直接从 Flash 下发页面（浏览器端透明解压，Content-Encoding: gzip）。
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+# 获取脚本所在目录的父目录（固件根目录）
+SCRIPT_DIR = Path(__file__).parent
+FIRMWARE_ROOT = SCRIPT_DIR.parent
+DATA_DIR = FIRMWARE_ROOT / "data"
+GENERATED_DIR = FIRMWARE_ROOT / "src" / "generated"
+
+# gzip 压缩等级：等级 9 对页面级（几十 KB）文件几乎没有体积优势，但明显更慢；
+# 日常迭代（每次改完页面重新生成头文件）默认用 6，发布前追求极限体积可用 --level 9
+DEFAULT_GZ_LEVEL = 6
+
+
+# 可选加速：python-isal（ISA-L 的 DEFLATE 实现，约 5-10x 于 zlib）
+# 未安装时退回标准库 zlib，输出仍是合法 gzip 流
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+# 分块喂给压缩器的块大小
+GZ_CHUNK_SIZE = 256 * 1024
+
+
+def file_sha256(src: Path) -> str:
+    """分块流式计算文件 sha256（不整读进内存）"""
+    hasher = hashlib.sha256()
+    with open(src, "rb") as f:
+        while chunk := f.read(GZ_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def gzip_file(src: Path, level: int) -> bytes:
+    """流式读取源文件并 gzip 压缩（wbits=31 直接产出 gzip 容器，头部无 mtime，可复现）
+
+    相比 read_bytes + gzip.compress 少一层 GzipFile/BytesIO 封装，
+    且读和压都按块走，内存峰值与块大小相关，而不是整个输入的副本。
+    """
+    if isal_zlib is not None:
+        # isal 的等级范围是 0..3，把 zlib 的 1..9 按比例映射过去
+        isal_level = min(3, max(0, round(level / 3)))
+        compressor = isal_zlib.compressobj(isal_level, isal_zlib.DEFLATED, 31)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    parts = []
+    with open(src, "rb") as f:
+        while chunk := f.read(GZ_CHUNK_SIZE):
+            parts.append(compressor.compress(chunk))
+    parts.append(compressor.flush())
+    return b"".join(parts)
+
+
+@dataclass
+class PageSpec:
+    """单个页面的嵌入配置：源文件名 -> C 符号名 / 生成头文件名"""
+    source: str
+    symbol: str
+    header: str
+
+
+# 支持嵌入的页面列表（与 data/ 目录保持一致）
+PAGES = [
+    PageSpec("web_controller.html", "kWebControllerPage", "web_controller_page.h"),
+    PageSpec("calibration.html", "kCalibrationPage", "calibration_page.h"),
+    PageSpec("motion_planner.html", "kMotionPlannerPage", "motion_planner_page.h"),
+]
+
+
+# 预生成 256 项查表，避免在几十 KB 的热循环里对每个字节做 f-string 格式化
+_HEX_BYTE = [f"0x{b:02X}" for b in range(256)]
+
+# 65536 项双字节对查表（"0xAA,0xBB"），把热循环的迭代次数再减半。
+# 表本身构建要花十几毫秒，所以按需懒构建：命中未变化缓存时完全不付这笔钱
+_hex_pair = None
+
+
+def _hex_pair_table():
+    global _hex_pair
+    if _hex_pair is None:
+        _hex_pair = [a + "," + b for a in _HEX_BYTE for b in _HEX_BYTE]
+    return _hex_pair
+
+
+# 字符串字面量转义表：可打印 ASCII 原样，其余（含 " 和 \）用三位八进制转义。
+# 固定三位可避免后随数字被并入转义序列
+_STR_BYTE = [
+    chr(b) if 32 <= b < 127 and b not in (0x22, 0x5C) else f"\\{b:03o}"
+    for b in range(256)
+]
+
+
+def to_c_string_lines(data: bytes, cols: int = 64):
+    """逐行产出 C 字符串字面量（相邻字面量自动拼接），每行 cols 个源字节
+
+    编译器解析长字符串比解析几万个逗号分隔的整数字面量快得多，
+    生成文件也小约 3 倍。
+    """
+    for i in range(0, len(data), cols):
+        chunk = data[i:i + cols]
+        yield '    "' + "".join(_STR_BYTE[b] for b in chunk) + '"'
+
+
+def to_c_array_lines(data: bytes, cols: int = 16):
+    """逐行产出每行 cols 个的 0xNN 十六进制数组内容（不拼接整块字符串）"""
+    pairs = _hex_pair_table()
+    for i in range(0, len(data), cols):
+        chunk = data[i:i + cols]
+        even = len(chunk) & ~1
+        parts = [pairs[(chunk[j] << 8) | chunk[j + 1]] for j in range(0, even, 2)]
+        if len(chunk) & 1:
+            parts.append(_HEX_BYTE[chunk[-1]])
+        line = ",".join(parts)
+        if i + cols < len(data):
+            line += ","
+        yield "    " + line
+
+
+def _stamp_of(out: Path) -> str:
+    """读取已生成头文件里的 sha256 戳（不存在或无戳返回空串）"""
+    if not out.exists():
+        return ""
+    with open(out, "r", encoding="utf-8", errors="ignore") as f:
+        for _ in range(8):
+            line = f.readline()
+            if line.startswith("// sha256: "):
+                return line[len("// sha256: "):].strip()
+    return ""
+
+
+def generate(spec: PageSpec, level: int = DEFAULT_GZ_LEVEL, fmt: str = "string") -> Path:
+    """压缩单个页面并生成 PROGMEM 头文件，返回输出路径
+
+    fmt="string"（默认）产出字符串字面量正文，编译快、文件小；
+    fmt="hex" 产出传统的 0xNN 数组，便于人工比对字节。
+    """
+    src = DATA_DIR / spec.source
+    raw_size = src.stat().st_size
+    out = GENERATED_DIR / spec.header
+
+    # 源文件与参数都没变时跳过重新压缩（戳写在头文件注释里，便于人工核对）；
+    # 哈希单独流式算一遍，命中缓存时完全不用跑压缩
+    stamp = hashlib.sha256(f"{file_sha256(src)} level={level} fmt={fmt}".encode("ascii")).hexdigest()
+    if _stamp_of(out) == stamp:
+        print(f"✓ 跳过（未变化）: {out.name}")
+        return out
+
+    gz = gzip_file(src, level)
+
+    guard = spec.header.upper().replace(".", "_") + "_"
+    prologue = [
+        "//",
+        "// This file is generated, dont directly modify content...",
+        f"// source: data/{spec.source} ({raw_size} bytes -> {len(gz)} bytes gzip)",
+        f"// sha256: {stamp}",
+        "//",
+        f"#ifndef {guard}",
+        f"#define {guard}",
+        "",
+        "#include <pgmspace.h>",
+        "",
+        f"const unsigned int {spec.symbol}Size = {len(gz)};",
+    ]
+    if fmt == "string":
+        prologue.append(f"const char {spec.symbol}[] PROGMEM =")
+        body_lines = to_c_string_lines(gz)
+        epilogue = [";"]
+    else:
+        prologue.append(f"const unsigned char {spec.symbol}[] PROGMEM = {{")
+        body_lines = to_c_array_lines(gz)
+        epilogue = ["};"]
+    epilogue += [
+        "",
+        f"#endif  // {guard}",
+    ]
+
+    GENERATED_DIR.mkdir(parents=True, exist_ok=True)
+    # 逐行写入带大缓冲的二进制文件：正文是 gzip 体积的数倍，
+    # 先 join 成整块再 write_text 会多出两份全量拷贝
+    with open(out, "wb", buffering=1024 * 1024) as f:
+        for line in prologue:
+            f.write(line.encode("utf-8") + b"\n")
+        for line in body_lines:
+            f.write(line.encode("ascii") + b"\n")
+        for line in epilogue:
+            f.write(line.encode("utf-8") + b"\n")
+    print(f"✓ 生成: {out.name} ({raw_size} -> {len(gz)} bytes, level={level})")
+    return out
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="embed web pages as gzip PROGMEM headers")
+    parser.add_argument(
+        "--level",
+        type=int,
+        default=DEFAULT_GZ_LEVEL,
+        choices=range(1, 10),
+        metavar="1..9",
+        help=f"gzip compress level (default: {DEFAULT_GZ_LEVEL})",
+    )
+    parser.add_argument(
+        "--format",
+        dest="fmt",
+        default="string",
+        choices=["string", "hex"],
+        help="payload emission: C string literal (fast to compile) or 0xNN hex array (default: string)",
+    )
+    parser.add_argument(
+        "--page",
+        action="append",
+        dest="pages",
+        metavar="NAME",
+        help="only embed the given page source (default: all pages)",
+    )
+    args = parser.parse_args(argv)
+
+    specs = PAGES
+    if args.pages:
+        specs = [s for s in PAGES if s.source in args.pages]
+        unknown = set(args.pages) - {s.source for s in specs}
+        if unknown:
+            print(f"❌ 未知页面: {', '.join(sorted(unknown))}")
+            return 1
+
+    existing = []
+    for spec in specs:
+        if (DATA_DIR / spec.source).exists():
+            existing.append(spec)
+        else:
+            print(f"⚠️  跳过不存在的页面: {spec.source}")
+    specs = existing
+
+    if len(specs) <= 1:
+        for spec in specs:
+            generate(spec, level=args.level, fmt=args.fmt)
+        return 0
+
+    # 多页面时各自独立压缩，放进进程池并行（压缩是计算密集型，绕开 GIL）
+    with ProcessPoolExecutor(max_workers=min(len(specs), os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(generate, spec, level=args.level, fmt=args.fmt) for spec in specs]
+        for fut in futures:
+            fut.result()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,16 +9,33 @@ import os
 import re
 import sys
 import json
+import time
+import hashlib
+import shutil
 import zipfile
 import subprocess
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
 
+# 可选加速：orjson（未安装时退回标准库 json；这些元数据都很小，属于锦上添花）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 加载环境变量
 load_dotenv()
 
+
+def dump_json_compact(obj) -> str:
+    """紧凑 JSON 序列化（优先 orjson，回退标准库）"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
 # 获取脚本所在目录的父目录（项目根目录）
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -39,45 +56,59 @@ SUPPORTED_ENVS = {
     }
 }
 RELEASE_DIR = PROJECT_ROOT / "release"
+# 上次成功探测到的 PlatformIO 路径缓存（跨脚本调用复用，避免每次都 spawn --version）
+PIO_CMD_CACHE = SCRIPT_DIR / ".pio_cmd_cache"
 BIN_FILES = ["bootloader.bin", "firmware.bin", "partitions.bin", "spiffs.bin"]
 
+# GitHub API 重试参数：瞬时网络错误 / 429 / 5xx 时做有界指数退避
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_BASE_S = 2
+
+# platformio.ini 解析用的正则（模块级预编译，避免每个环境都重新编译/全文多次扫描）
+ENV_HEADER_RE = re.compile(r'\[env:([^\]]+)\]')
+FIRMWARE_VERSION_RE = re.compile(r'FIRMWARE_VERSION="([^"]+)"')
+
 class ReleaseManager:
-    def __init__(self, build_envs=None):
+    def __init__(self, build_envs=None, clean=False):
         """
         初始化发布管理器
         :param build_envs: 要构建的环境列表，None 表示构建所有环境
+        :param clean: 构建前是否先 clean（默认 False，依赖 PlatformIO 增量构建）
         """
         self.build_envs = build_envs or list(SUPPORTED_ENVS.keys())
+        self.clean = clean
         self.platformio_cmd = None
         self.release_packages = []  # 存储每个环境的发布包信息
+        self._platformio_ini_content = None  # platformio.ini 内容缓存（各环境共用一次读取）
+        # 整个发布流程共用同一个构建时间戳：各环境的 README / version.json /
+        # Release 说明保持一致，也便于事后对账
+        self.build_time = datetime.now()
         
     def get_version_from_platformio(self, env_name):
         """从 platformio.ini 中读取指定环境的版本号"""
         try:
             platformio_ini_path = PROJECT_ROOT / 'platformio.ini'
-            with open(platformio_ini_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # 查找指定环境的 FIRMWARE_VERSION 定义
-            # 先找到环境块的开始位置
-            env_start_pattern = rf'\[env:{re.escape(env_name)}\]'
-            env_start_match = re.search(env_start_pattern, content)
-            if not env_start_match:
+            if self._platformio_ini_content is None:
+                self._platformio_ini_content = platformio_ini_path.read_text(encoding='utf-8')
+            content = self._platformio_ini_content
+
+
+            # 一次扫描找出所有环境块的边界，再定位目标环境
+            env_headers = list(ENV_HEADER_RE.finditer(content))
+            env_block = None
+            for idx, header in enumerate(env_headers):
+                if header.group(1) == env_name:
+                    env_end_pos = (
+                        env_headers[idx + 1].start() if idx + 1 < len(env_headers) else len(content)
+                    )
+                    env_block = content[header.end():env_end_pos]
+                    break
+            if env_block is None:
                 print(f"❌ 未在 platformio.ini 中找到环境 {env_name}")
                 return None
-            
-            # 找到下一个环境块的开始位置（或文件结尾）
-            env_start_pos = env_start_match.end()
-            next_env_match = re.search(r'\n\[env:', content[env_start_pos:])
-            if next_env_match:
-                env_end_pos = env_start_pos + next_env_match.start()
-            else:
-                env_end_pos = len(content)
-            
+
             # 在当前环境块内查找 FIRMWARE_VERSION
-            env_block = content[env_start_pos:env_end_pos]
-            version_pattern = r'FIRMWARE_VERSION="([^"]+)"'
-            version_match = re.search(version_pattern, env_block)
+            version_match = FIRMWARE_VERSION_RE.search(env_block)
             
             if version_match:
                 version = version_match.group(1)
@@ -90,42 +121,66 @@ class ReleaseManager:
             print(f"❌ 未找到 platformio.ini 文件: {platformio_ini_path}")
             return None
     
-    def check_platformio(self):
-        """检查 PlatformIO 是否安装"""
-        # 尝试多个可能的 PlatformIO 路径
-        possible_paths = [
-            'platformio',  # 系统 PATH 中
-            'pio',         # 系统 PATH 中
-        ]
-        
-        # Windows 特定路径
+    @staticmethod
+    def find_platformio():
+        """定位 PlatformIO 可执行文件：环境变量 > PATH > 默认 penv 安装目录"""
+        # 显式指定优先：PLATFORMIO_CMD（可写在 scripts/.env 里）
+        env_cmd = os.environ.get('PLATFORMIO_CMD')
+        if env_cmd:
+            resolved = env_cmd if os.path.isfile(env_cmd) else shutil.which(env_cmd)
+            if resolved:
+                return resolved
+            print(f"⚠️  PLATFORMIO_CMD 指向的命令不存在: {env_cmd}，继续自动探测")
+
+        for name in ('platformio', 'pio'):
+            found = shutil.which(name)
+            if found:
+                return found
+
+        # PATH 里没有时，回退到 PlatformIO 默认的 penv 安装目录
         if os.name == 'nt':
-            user_profile = os.environ.get('USERPROFILE', '')
-            if user_profile:
-                possible_paths.extend([
-                    os.path.join(user_profile, '.platformio', 'penv', 'Scripts', 'platformio.exe'),
-                    os.path.join(user_profile, '.platformio', 'penv', 'Scripts', 'pio.exe'),
-                ])
-        
-        # Linux/macOS 特定路径
+            penv_bin = os.path.join(os.environ.get('USERPROFILE', ''), '.platformio', 'penv', 'Scripts')
+            names = ('platformio.exe', 'pio.exe')
         else:
-            home = os.environ.get('HOME', '')
-            if home:
-                possible_paths.extend([
-                    os.path.join(home, '.platformio', 'penv', 'bin', 'platformio'),
-                    os.path.join(home, '.platformio', 'penv', 'bin', 'pio'),
-                ])
-        
-        for pio_path in possible_paths:
+            penv_bin = os.path.join(os.environ.get('HOME', ''), '.platformio', 'penv', 'bin')
+            names = ('platformio', 'pio')
+        for name in names:
+            candidate = os.path.join(penv_bin, name)
+            if os.path.isfile(candidate):
+                return candidate
+        return None
+
+    def check_platformio(self):
+        """检查 PlatformIO 是否安装（结果缓存在 self.platformio_cmd 与缓存文件）"""
+        if self.platformio_cmd:
+            return True
+
+        # 快路径：上次探测成功的路径还在（一次 stat，无锁无子进程）就直接复用
+        try:
+            cached = PIO_CMD_CACHE.read_text(encoding='utf-8').strip()
+            if cached and os.path.isfile(cached):
+                self.platformio_cmd = cached
+                return True
+        except OSError:
+            pass
+
+        pio_path = self.find_platformio()
+        if pio_path:
             try:
-                result = subprocess.run([pio_path, '--version'], 
-                                      capture_output=True, text=True, check=True)
+                # 只需要 stdout 的版本串；stderr 不关心，直接丢弃
+                result = subprocess.run([pio_path, '--version'],
+                                      stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                      text=True, check=True)
                 print(f"✓ PlatformIO 版本: {result.stdout.strip()}")
                 self.platformio_cmd = pio_path
+                try:
+                    PIO_CMD_CACHE.write_text(pio_path, encoding='utf-8')
+                except OSError:
+                    pass  # 缓存写不进去也不影响本次运行
                 return True
             except (subprocess.CalledProcessError, FileNotFoundError):
-                continue
-        
+                pass
+
         print("❌ PlatformIO 未安装或不在 PATH 中")
         print("请访问 https://platformio.org/install 安装 PlatformIO")
         return False
@@ -134,44 +189,57 @@ class ReleaseManager:
         """构建指定环境的固件"""
         print(f"🔨 开始构建固件 [{env_name}]...")
         try:
-            # 切换到项目根目录
-            original_cwd = os.getcwd()
-            os.chdir(PROJECT_ROOT)
-            
             # 清理并构建
-            print(f"  🧹 清理环境 {env_name}...")
-            subprocess.run([self.platformio_cmd, 'run', '-e', env_name, '--target', 'clean'], 
-                         check=True, capture_output=True)
-            
-            # 构建固件
+            # 成功路径不消费 pio 的 stdout，直接丢弃，省掉管道缓冲与解码；
+            # 只保留 stderr 供失败时打印
+            # 默认跳过 clean，依赖 PlatformIO 的增量构建（改动小的发布快得多）；
+            # 怀疑构建缓存有问题时可用 --clean 强制全量重建
+            if self.clean:
+                print(f"  🧹 清理环境 {env_name}...")
+                subprocess.run([self.platformio_cmd, 'run', '-e', env_name, '--target', 'clean'],
+                             check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                             cwd=PROJECT_ROOT)
+
+            # 并行构建固件与 SPIFFS 镜像：firmware.bin 与 spiffs.bin 互不依赖
+            # （后者只打包 data/ 目录），两个 pio 进程同时跑可省掉串行等待
             print(f"  ⚙️  构建固件 {env_name}...")
-            result = subprocess.run([self.platformio_cmd, 'run', '-e', env_name], 
-                                  check=True, capture_output=True, text=True)
-            print(f"  ✓ [{env_name}] 固件构建成功")
-            
-            # 构建文件系统镜像
+            fw_proc = subprocess.Popen([self.platformio_cmd, 'run', '-e', env_name],
+                                     stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                                     cwd=PROJECT_ROOT)
             print(f"  📁 构建 SPIFFS 文件系统镜像 [{env_name}]...")
-            result = subprocess.run([self.platformio_cmd, 'run', '-e', env_name, '--target', 'buildfs'], 
-                                  check=True, capture_output=True, text=True)
+            fs_proc = subprocess.Popen([self.platformio_cmd, 'run', '-e', env_name, '--target', 'buildfs'],
+                                     stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                                     cwd=PROJECT_ROOT)
+
+            fw_err = fw_proc.communicate()[1]
+            fs_err = fs_proc.communicate()[1]
+            if fw_proc.returncode != 0:
+                print(f"  ❌ [{env_name}] 固件构建失败")
+                if fw_err:
+                    print(f"  错误输出: {fw_err}")
+                return False
+            print(f"  ✓ [{env_name}] 固件构建成功")
+            if fs_proc.returncode != 0:
+                print(f"  ❌ [{env_name}] SPIFFS 文件系统镜像构建失败")
+                if fs_err:
+                    print(f"  错误输出: {fs_err}")
+                return False
             print(f"  ✓ [{env_name}] SPIFFS 文件系统镜像构建成功")
-            
+
             return True
         except subprocess.CalledProcessError as e:
             print(f"  ❌ [{env_name}] 构建失败: {e}")
             if hasattr(e, 'stderr') and e.stderr:
                 print(f"  错误输出: {e.stderr}")
             return False
-        finally:
-            # 恢复原始工作目录
-            os.chdir(original_cwd)
     
     def create_readme(self, env_name, version, env_info):
-        """创建烧录说明文档"""
+        """生成烧录说明文档内容（直接返回字符串，由打包流程写入 zip）"""
         readme_content = f"""# {env_info['name']} 固件烧录说明
 
 ## 版本信息
 - **固件版本**: {version}
-- **构建时间**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+- **构建时间**: {self.build_time.strftime('%Y-%m-%d %H:%M:%S')}
 - **目标板**: ESP32 (NodeMCU-32S)
 - **机器人类型**: {env_info['description']}
 
@@ -234,14 +302,11 @@ class ReleaseManager:
 ## 技术支持
 如有问题，请访问项目 GitHub 页面提交 Issue。
 """
-        
-        readme_path = PROJECT_ROOT / f'README_{env_name}.md'
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
-        print(f"  ✓ 创建烧录说明文档: README_{env_name}.md")
-        return readme_path
-    
-    def create_zip_package(self, env_name, version, env_info):
+
+        print(f"  ✓ 生成烧录说明文档 [{env_name}]")
+        return readme_content
+
+    def create_zip_package(self, env_name, version, env_info, readme_content=None):
         """创建 ZIP 发布包"""
         build_dir = PROJECT_ROOT / f".pio/build/{env_name}"
         if not build_dir.exists():
@@ -258,46 +323,82 @@ class ReleaseManager:
         
         print(f"  📦 创建发布包: {zip_filename}")
         
+        checksums = {}
         with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
             # 添加 bin 文件
             for bin_file in BIN_FILES:
                 bin_path = build_dir / bin_file
                 if bin_path.exists():
-                    zipf.write(bin_path, bin_file)
+                    # 固件镜像基本是高熵数据，再过一遍 DEFLATE 只费时间不省体积，
+                    # 直接原样存储；README/version.json 等文本仍走默认压缩。
+                    # 边写 zip 边算 sha256，同一次读盘顺带产出校验和
+                    hasher = hashlib.sha256()
+                    zinfo = zipfile.ZipInfo.from_file(bin_path, bin_file)
+                    zinfo.compress_type = zipfile.ZIP_STORED
+                    with open(bin_path, 'rb') as src, zipf.open(zinfo, 'w') as dst:
+                        while chunk := src.read(1024 * 1024):
+                            hasher.update(chunk)
+                            dst.write(chunk)
+                    checksums[bin_file] = hasher.hexdigest()
                     print(f"    ✓ 添加: {bin_file}")
                 else:
                     print(f"    ⚠️  文件不存在: {bin_file}")
             
-            # 添加说明文档
-            readme_path = PROJECT_ROOT / f'README_{env_name}.md'
-            if readme_path.exists():
-                zipf.write(readme_path, 'README.md')
+            # 添加说明文档（内容在内存中，免去先落盘再读回的往返）
+            if readme_content:
+                zipf.writestr('README.md', readme_content)
                 print(f"    ✓ 添加: README.md")
             
             # 添加版本信息
             version_info = {
                 "version": version,
-                "build_time": datetime.now().isoformat(),
+                "build_time": self.build_time.isoformat(),
                 "build_env": env_name,
                 "robot_type": env_info['description'],
-                "files": BIN_FILES
+                "files": BIN_FILES,
+                "sha256": checksums
             }
-            zipf.writestr('version.json', json.dumps(version_info, indent=2))
+            # 机器读取的元数据，紧凑序列化即可（不需要缩进美化）
+            zipf.writestr('version.json', dump_json_compact(version_info))
             print(f"    ✓ 添加: version.json")
         
         print(f"  ✓ 发布包创建完成: {zip_path}")
-        
-        # 删除临时 README 文档
-        if readme_path.exists():
-            readme_path.unlink()
-            print(f"  ✓ 删除临时 README 文档")
-        
+
+        # 生成校验清单：下游烧录工具凭它即可校验本地 bin，而无需重新下载整个 zip
+        manifest_filename = f"{package_name}-Firmware-v{version}-manifest.json"
+        manifest_path = RELEASE_DIR / manifest_filename
+        zip_hasher = hashlib.sha256()
+        with open(zip_path, 'rb') as f:
+            while chunk := f.read(1024 * 1024):
+                zip_hasher.update(chunk)
+        manifest = {
+            "version": version,
+            "build_env": env_name,
+            "zip": {
+                "name": zip_filename,
+                "size": os.path.getsize(zip_path),
+                "sha256": zip_hasher.hexdigest(),
+            },
+            "files": {
+                bin_file: {
+                    "size": os.path.getsize(build_dir / bin_file),
+                    "sha256": checksums[bin_file],
+                }
+                for bin_file in checksums
+            },
+        }
+        manifest_path.write_text(dump_json_compact(manifest), encoding='utf-8')
+        print(f"  ✓ 校验清单创建完成: {manifest_path}")
+
         return {
             "env": env_name,
             "version": version,
             "zip_filename": zip_filename,
             "zip_path": zip_path,
-            "env_info": env_info
+            "manifest_filename": manifest_filename,
+            "manifest_path": manifest_path,
+            "env_info": env_info,
+            "checksums": checksums
         }
     
     def get_changelog(self):
@@ -335,14 +436,11 @@ class ReleaseManager:
             print("❌ 没有可发布的包")
             return False
         
-        # 获取仓库信息
+        # 获取仓库信息（git 命令用 cwd= 定位项目根目录，不改全局工作目录）
         try:
-            # 切换到项目根目录执行 git 命令
-            original_cwd = os.getcwd()
-            os.chdir(PROJECT_ROOT)
-            
-            result = subprocess.run(['git', 'remote', 'get-url', 'origin'], 
-                                  capture_output=True, text=True, check=True)
+            result = subprocess.run(['git', 'remote', 'get-url', 'origin'],
+                                  capture_output=True, text=True, check=True,
+                                  cwd=PROJECT_ROOT)
             repo_url = result.stdout.strip()
             # 解析仓库名 (假设格式: https://github.com/owner/repo.git)
             match = re.search(r'github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?$', repo_url)
@@ -353,9 +451,6 @@ class ReleaseManager:
         except subprocess.CalledProcessError:
             print("❌ 无法获取 Git 远程仓库信息")
             return False
-        finally:
-            # 恢复原始工作目录
-            os.chdir(original_cwd)
         
         print(f"📤 准备发布到 GitHub: {owner}/{repo}")
         
@@ -366,22 +461,23 @@ class ReleaseManager:
         # 获取更新内容描述（可从环境变量或代码中配置）
         changelog = self.get_changelog()
         
-        # 生成 Release 说明
+        # 生成 Release 说明（固件列表先 join 好，整体一个 f-string 拼出，避免逐行 += 重建字符串）
+        firmware_list = "\n".join(
+            f"- **{pkg['env_info']['name']}** v{pkg['version']} - `{pkg['zip_filename']}`"
+            for pkg in self.release_packages
+        )
         release_body = f"""## {PROJECT_NAME} 固件 v{release_version}
 
 ### 更新内容
 {changelog}
 
 ### 构建信息
-- 构建时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+- 构建时间: {self.build_time.strftime('%Y-%m-%d %H:%M:%S')}
 - 包含固件: {len(self.release_packages)} 个环境
 
 ### 固件列表
-"""
-        for pkg in self.release_packages:
-            release_body += f"- **{pkg['env_info']['name']}** v{pkg['version']} - `{pkg['zip_filename']}`\n"
-        
-        release_body += f"""
+{firmware_list}
+
 ### 下载说明
 请根据您的机器人类型下载对应的固件包，解压后按照 README.md 中的说明进行烧录。
 
@@ -409,36 +505,107 @@ class ReleaseManager:
             'Accept': 'application/vnd.github.v3+json'
         }
         
-        # 创建 Release
-        url = f'https://api.github.com/repos/{owner}/{repo}/releases'
-        response = requests.post(url, json=release_data, headers=headers)
-        
-        if response.status_code != 201:
-            print(f"❌ 创建 Release 失败: {response.status_code}")
-            print(f"错误信息: {response.text}")
-            return False
-        
-        release_info = response.json()
-        release_id = release_info['id']
-        print(f"✓ Release 创建成功: {release_info['html_url']}")
-        
-        # 上传所有文件
-        for pkg in self.release_packages:
-            upload_url = f'https://uploads.github.com/repos/{owner}/{repo}/releases/{release_id}/assets?name={pkg["zip_filename"]}'
-            
-            with open(pkg['zip_path'], 'rb') as f:
-                headers['Content-Type'] = 'application/zip'
-                response = requests.post(upload_url, headers=headers, data=f)
-                
+        # 整个发布流程共用一个 Session：TLS 握手只做一次，
+        # 上传走 keep-alive 连接池（Session 的并发使用是线程安全的）
+        with requests.Session() as session:
+            # tag 已存在时直接复用对应 Release（重复执行发布脚本的幂等短路，
+            # 省掉必然失败的创建请求）
+            tag_name = release_data["tag_name"]
+            check = session.get(
+                f'https://api.github.com/repos/{owner}/{repo}/releases/tags/{tag_name}',
+                headers=headers,
+            )
+            if check.status_code == 200:
+                release_info = check.json()
+                release_id = release_info['id']
+                print(f"⚠️  Release {tag_name} 已存在，复用并继续上传资产: {release_info['html_url']}")
+            else:
+                # 创建 Release
+                url = f'https://api.github.com/repos/{owner}/{repo}/releases'
+                response = self.github_post(session, url, headers=headers, json_data=release_data)
+
                 if response.status_code != 201:
-                    print(f"❌ 上传文件失败 {pkg['zip_filename']}: {response.status_code}")
+                    print(f"❌ 创建 Release 失败: {response.status_code}")
                     print(f"错误信息: {response.text}")
                     return False
-                
-                print(f"✓ 文件上传成功: {pkg['zip_filename']}")
-        
+
+                release_info = response.json()
+                release_id = release_info['id']
+                print(f"✓ Release 创建成功: {release_info['html_url']}")
+
+            # 并发上传所有文件（上传是网络 IO，多环境时可以并行）
+            with ThreadPoolExecutor(max_workers=min(4, len(self.release_packages))) as pool:
+                upload_results = list(pool.map(
+                    lambda pkg: self.upload_release_asset(session, owner, repo, release_id, github_token, pkg),
+                    self.release_packages,
+                ))
+            if not all(upload_results):
+                return False
+
         print(f"🎉 发布完成! 访问: {release_info['html_url']}")
         return True
+
+    @staticmethod
+    def github_post(session, url, headers=None, json_data=None, data_factory=None):
+        """带有界指数退避的 POST；data_factory 每次重试时重新产生请求体（如重开文件）"""
+        last_response = None
+        last_error = None
+        for attempt in range(HTTP_MAX_RETRIES + 1):
+            if attempt:
+                delay = HTTP_BACKOFF_BASE_S * (2 ** (attempt - 1))
+                print(f"  ⏳ {delay}s 后第 {attempt}/{HTTP_MAX_RETRIES} 次重试: {url}")
+                time.sleep(delay)
+            data = data_factory() if data_factory else None
+            try:
+                last_response = session.post(url, headers=headers, json=json_data, data=data)
+            except requests.RequestException as e:
+                last_error = e
+                continue
+            finally:
+                if data is not None and hasattr(data, 'close'):
+                    data.close()
+            # 4xx（除 429）是确定性失败，重试没有意义
+            if last_response.status_code == 429 or last_response.status_code >= 500:
+                continue
+            return last_response
+        if last_response is not None:
+            return last_response
+        raise last_error
+
+    def upload_release_asset(self, session, owner, repo, release_id, github_token, pkg):
+        """上传单个发布包（zip + 校验清单）到指定 Release"""
+        if not self._upload_asset_file(session, owner, repo, release_id, github_token,
+                                       pkg['zip_path'], pkg['zip_filename'], 'application/zip'):
+            return False
+        if pkg.get('manifest_path'):
+            return self._upload_asset_file(session, owner, repo, release_id, github_token,
+                                           pkg['manifest_path'], pkg['manifest_filename'],
+                                           'application/json')
+        return True
+
+    def _upload_asset_file(self, session, owner, repo, release_id, github_token,
+                           file_path, asset_name, content_type):
+        """上传单个文件资产（线程安全：headers 按请求独立构建）"""
+        upload_url = f'https://uploads.github.com/repos/{owner}/{repo}/releases/{release_id}/assets?name={asset_name}'
+
+        # 直接把文件对象交给 requests 分块流式上传（不整包读进内存），
+        # 显式带上 Content-Length 避免退化成 chunked 编码
+        headers = {
+            'Authorization': f'token {github_token}',
+            'Accept': 'application/vnd.github.v3+json',
+            'Content-Type': content_type,
+            'Content-Length': str(os.path.getsize(file_path)),
+        }
+        response = self.github_post(session, upload_url, headers=headers,
+                                    data_factory=lambda: open(file_path, 'rb'))
+
+        if response.status_code != 201:
+            print(f"❌ 上传文件失败 {asset_name}: {response.status_code}")
+            print(f"错误信息: {response.text}")
+            return False
+
+        print(f"✓ 文件上传成功: {asset_name}")
+        return True
     
     def run(self):
         """执行完整的发布流程"""
@@ -457,29 +624,39 @@ class ReleaseManager:
             print(f"支持的环境: {', '.join(SUPPORTED_ENVS.keys())}")
             return False
         
-        # 3. 为每个环境构建和打包
+        # 3.1 获取各环境版本号
+        env_versions = {}
         for env_name in self.build_envs:
-            print(f"\n{'='*50}")
-            print(f"📦 处理环境: {env_name} ({SUPPORTED_ENVS[env_name]['name']})")
-            print(f"{'='*50}")
-            
-            # 3.1 获取版本号
             version = self.get_version_from_platformio(env_name)
             if not version:
                 print(f"⚠️  跳过环境 {env_name}（无法获取版本号）")
                 continue
-            
-            # 3.2 构建固件
-            if not self.build_firmware(env_name):
+            env_versions[env_name] = version
+
+        # 3.2 并行构建各环境固件（各环境的构建目录相互独立，构建是外部进程，
+        # 多环境时并行能把总构建时间压到最慢的那个环境）
+        if len(env_versions) > 1:
+            with ThreadPoolExecutor(max_workers=len(env_versions)) as pool:
+                build_ok = dict(zip(env_versions, pool.map(self.build_firmware, env_versions)))
+        else:
+            build_ok = {env_name: self.build_firmware(env_name) for env_name in env_versions}
+
+        # 3.3 逐环境打包
+        for env_name, version in env_versions.items():
+            print(f"\n{'='*50}")
+            print(f"📦 处理环境: {env_name} ({SUPPORTED_ENVS[env_name]['name']})")
+            print(f"{'='*50}")
+
+            if not build_ok.get(env_name):
                 print(f"⚠️  跳过环境 {env_name}（构建失败）")
                 continue
-            
-            # 3.3 创建说明文档
+
+            # 创建说明文档
             env_info = SUPPORTED_ENVS[env_name]
-            readme_path = self.create_readme(env_name, version, env_info)
-            
-            # 3.4 创建发布包
-            package_info = self.create_zip_package(env_name, version, env_info)
+            readme_content = self.create_readme(env_name, version, env_info)
+
+            # 创建发布包
+            package_info = self.create_zip_package(env_name, version, env_info, readme_content)
             if package_info:
                 self.release_packages.append(package_info)
         
@@ -513,6 +690,7 @@ def main():
     python release.py -e nodemcu-32s     # 只构建六足机器人固件
     python release.py -e nodequadmini    # 只构建四足机器人固件
     python release.py -e nodemcu-32s -e nodequadmini  # 构建多个指定环境
+    python release.py --clean            # 构建前先清理（默认增量构建）
 
 环境要求:
     - Python 3.6+
@@ -542,10 +720,14 @@ def main():
     
     # 解析命令行参数
     build_envs = None
+    clean = False
     i = 1
     while i < len(sys.argv):
         arg = sys.argv[i]
-        if arg in ['-e', '--env']:
+        if arg in ['--clean']:
+            clean = True
+            i += 1
+        elif arg in ['-e', '--env']:
             if i + 1 < len(sys.argv):
                 if build_envs is None:
                     build_envs = []
@@ -562,7 +744,7 @@ def main():
             print("使用 --help 查看帮助信息")
             sys.exit(1)
     
-    manager = ReleaseManager(build_envs=build_envs)
+    manager = ReleaseManager(build_envs=build_envs, clean=clean)
     success = manager.run()
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,121 @@
+//
+// This file is generated, dont directly modify content...
+// source: data/calibration.html (20865 bytes -> 6772 bytes gzip)
+// sha256: 43def084c091f0448c24e9fb992bc2fe48091154745569823f20bcbf59004849
+//
+#ifndef CALIBRATION_PAGE_H_
+#define CALIBRATION_PAGE_H_
+
+#include <pgmspace.h>
+
+const unsigned int kCalibrationPageSize = 6772;
+const char kCalibrationPage[] PROGMEM =
+    "\037\213\010\000\000\000\000\000\000\003\315<kw\333\306\225\337\365+&\354\266$\033\003\304\223\004i\311][U\032\367\330I\326\226\323m]\237\024\002A\0225D\260\000(YNu\216\232\304\215\235\304I\266"
+    "\333&i\342\324v\232\264\336\323\306y\264q\034\307\251\317\331\237\3225)\351S\376\302\336;\203\307\200\000i)\335\315\3519\042\011\314\334\327\334\327\334\031\0144\377\320w\037_\134\376\341\023K\344\321\345\343"
+    "\307\016\315\315\367\302U\027\177l\263}h\216\220\371U;4\211\3253\375\300\016\027J\247\226\037\021\214\022\355\010\302\015\327&\341\306\300^(\205\366\271\260f\005\001\355!D\014\235\020\372\236\2467\204`\257"
+    "`\272N\267\337\042\226\335\017m\377`\3243\360\002't<h\367m\327\014\2355;\356\351x\375P\010\234\363v\213\250\312\340\134\334\274j\372]\007\300\025ip\216H\254u\223\361t\315~W\010\326\235"
+    "\320\352%\234S\372\346J\340\271\3030\241\357;\335^\310\350\304M\2417h\021]\372fr\357\233\375\240\343\371\253-v\011\002\332?\254\010\000Q\215AVL\353l\327\367\206\375\266`y\256\347\267\3107"
+    "\344\245\246\364\310#1@\324\272\336sR\326+\236\337\266\241\261\357\365'\332\004\337l;\303\240E\214T\252\201\331n;\375.m#\262\236vp\032\222\265\264\331\032\372\001\262\034x\016\257\351\025\357\234\020"
+    "\364\314\266\267\336\042\022\001x\362\215f\263\231\031j\254)\327%\222\250\006\323\224\333\352yk\266\237\250\270@\005\322J\243\3356\247\342\233\026\032:%\220\221LA\311\352\365\372\003\214\240\031\261\021\030\003\306"
+    "\345gC\263\017\256\267\221\320^w\332a\257E4\316\312=;\262<\247\343\351\016Z\250d\216\345\3120\014\275~\302/\322\300\212\013J\311\373H\213\270\310{\305\035\346|\001\207\015\016\352\264A{\2224"
+    "\305+\324\007Zyo\342N\265 \330\316h,.-\035\311\253\326\002\312\276\347\012\214B\260\207\330\236\036\252\305\024'T\031\231N\221\012l\307\3333f#\021Y*\016\216\372D\363zDe\305s\333y"
+    "\261\134\273+\2406\006\211$m'\030\270\346F\2138}\327\351\333\302\212\353\245\326\215\331\327\013\042\226\263Wlg9\265s\307\232fg\216VAtu:\035\263\223\240\202!C\3072\335\330\006\220\304\342"
+    ".\232t\204``Z6&\233u\337\034\024\017\3275Wl7?\334\3148\247h.\253\351\134\242\026V<0*\304.\237\240\242q\250\252\232\027\347\247\350\317B\344\032\373\263\200\134`\001y\226&\013\222"
+    "rQ\250M\325p^\356=+2\322\227\224\327\012\227\372&T\250\024\304\263\323\037\014\303\323l\016f\361S:\223\213\240zA\362\233\214\211\257\024*\240\024g\3057q\332\240&3\3016\376\2362\3039"
+    "!\022N\316\304w\032\313\3460\364\362\014}o=!\237\230\235K/3|\236\020\314y\035\327[\027\316\265\212\311\327\276M\266\377\370\371\350\205\033\333\177\372`w\353\231\335\013\227\311\267k\264\347_W\355"
+    "\266c\222\012'x\243\016\363G5\221\246 m\200\210`\275\2424\306\345F\2761\361Z\256u3\372\215\331\024\307\007\247\271B\202\322t\202\271)3\361\033U\347i%\236\223\021yJ\360O0\231\351\245"
+    "\134\246/\344'\355\237_AR\313\242\312y[\344\303l\232\362g\020n\316\240+O\247\313\273ujJ\203\367\353\315\310YcG\335\275\376\311\316son\177\361\361\350\325\313\343k\237\216\356\276\022\373\252"
+    "\330\361\274\220\013\303H\014Z\334\362\363f\352mRQ\222\304Z\245o\233>85\244D\010\337\212\254\352m\273{\000ST\303\266M\042}\023\256\033um\305T \010\271\242\270(\275NO\006\023\211\227"
+    "\2063\213i\302\315\217|\211(`\365\012\231\212\370\335\025\263\042\035 \321\237(gJ\302H\0214X\200#\247\220$\210\215\275%\237\230RvU\263\277\274\231\367\007)\233\317c&\240\366\263A~\016\351"
+    "\270v\302\342\247\303 t:\033\361\310&5\3325\301\324\231\225\002\340\012\230\012'S\042\357\033\2622]\236\251\0231/\025\265\256\0006_\015\012%2r\223]\336C\332\266\345\261\011%\273<\232\262\326"
+    "\231\2726\342\375\230z\211\242\353\007H\372%\211Ju\212\003fV\204\017Z\026q:\232QT\027K\240V3l\362k\0340H\2658\0020\000\214\202\000P\012\003\300\261\212\312\352\202\242 \343\221\3635"
+    "\272\300?47_c{\001\363+^{\203\256\374{2\261\1343\010`\335\217\021\021-\372\347a\326\355\023\247\275P\032\230]{\231\365\354\134\374d|\345\316\370\332\365\321\363\277\004\212\000\021\001G\325~"
+    "D\207[\036\226\210\327\267\134\307:\013\324\275n\327\265\217A\337\020(V\252\245CK\375\256\353\004\275\371\032C\247\322\324z2\375m;k\214\273\267n\373G\314v\327>\016\352\017K\207\346k\320uh"
+    ".\206\211X\026\026/\361Px\270\3542%\202HG\200,\027\017\037;z\344\304\341\345\245\223\313\207O,\227Hf\252K\307\303\032\350M%\3549A\365`\211\264\315\320\024\316\367\026J\243\273[\243?"
+    "\276\3104\0255\333\375\205\322\311\320\364C\262\230\012[:\304C\362\232\230.\325\341'\227\276\232P\367\357\275=z\377\215\321g\267v\356\375z\364\326\357x\271LX\302\177\213\234\260\303\241\0172M\000f"
+    "\305J\015\000\327\017\011\002\331\271po\367\331\033l\004\243\227\356\214\256^\375\362\356\233\243\267\336\332\271\365\227\332\350\302\373\3603\272\360\321\366\257o\334\277\2755z\357u\2723\365\345\335\227v\337\276Fj"
+    "\346\300\251Y\346  \343\227\337\331\375\325E\250\326\306[\277\030\337\376x|\365?\211 p\346C\015@\035\020\234\200 (\305\306\204\231\266D\250_\243\227\306\213\004VA&\226\035\277\377\373\321\225\033\243"
+    "\027\256\355|\361\0058\357\350w/\336\277w}\374\213\017DQ\344\207\303\217\213\216\212\237\223#Y\346\243\3118b\317\356\012\234,;U\245>\226\007a\021GG\307Z\242@\003\247\030\337yu\367\372g"
+    "\333o\335$\377\375)y\314k\333\217\332\347L\202#\370\355\215\373w\356$bO\241L'\236\2045\200\230\244\347\333\235\205R/\014\007A\253V\243U\265\270\342\200+\302\007\326\357\2535C\257\353\212\254"
+    "\312\340]0\225\340\006\341S+\020\313gK\005\264\001\006E](\035\331\376\323o\357\337\376\034\324\305q\303\374\261\326\235@\303\314U\042k\216\275~\304;\267P\222p\177H\203\277\022\3518\256\013\2619"
+    "\364}\320\327\042N'\031Z@m`\206=\002Z:.7DCV\211&\326u\265'\032\272f\311\242.\213\222\016\224\304F\275)\352\015\203\250b\243\241\022\350hh\360-I\232\330l\352x\217\374D"
+    "Ek\342u\035\301\352k\015Q\255[\202(\251ul\224\005Q\207\036JJ\210\201\032j \000Z]a$\204\204|\375Q]\204\205\257%0L\240!0L$\302\300(\221\223\214\274\001\362\032\270\265\001"
+    "<\265\306\232@YS,\304\227)\022\342SQ)~\235\211/\200\374(\024\210\200\240\012IH7\264\036\134j.\134\313\015\015\277\025S\026\025\025\307\215\337\250d\220L\005h\261)\325-\011\256\365:@"
+    "\001\315\272n\304\035\015W\224\224\206\200_\026p\201+P\022PW)\252\330T\330/H\015\364P\365H\001\232\261\365X\023\033\300\042\232\006\203i\310\364#\253\232(k\212(\033\015\021\134\252\247!US"
+    "4\324:~\230XD\224\353\002\366\272\012(F\305\241k{b_\007\272`\363\246\322\024)]\012\2556Q\2012\375\205\001!\240\252\353\002\025\264\2567\042JR\375\374qj3\202X`\367\206V\027%"
+    "\331\000\315a\277\322@[\030\006U\257\250KuQk\032\002\232\224\340\230\340\312@\223\030M\015\374FW`\274`K\250\232E\305 \310ZO\000T\300n 6a\312h\350\264\235R\356\3110\026\025\264"
+    "\005\314\005$Adf\010\245\241S \001\241\220\275\200\024\042_\224a\270@]\240\324\321y\200?\305F\371`\240\012\035D\263.$P\032\016\241\2014\032\002\225\002\272@%\011\207\363\307A:\350\220@"
+    "\353\300\237\352\326\320\230iU\225)Dg\3125@\234:\252\273Y_CWS\031k\3246\250\030\206-\303/\3662\323) \017\270\231\332@\327\245\244\264@@\342h\017\235\266\241A\320\000x\013(\002"
+    "\362@$\270B\244\372\223\262\202\036%1\303\301\340\021\037%\001\026M\015\254\247\033\210\334\300\030@\344:\266\322\213\363\253\020d\377\274#b&C7\225\001\020\330\260^\206B\375\276\0369+#\251\376\250"
+    "T\313d\326\032\244\326l\252\215K\2658\233/C\365]:\204\231\271E\306\277\275\263\273umt\373\342S'<X\2558V\260\370$_\2731\222\346\214\231\242\353\204\275\341\012\235!\236t<H\376\307"
+    "l{_S\304\367\234\360\321\341\312\3279I(DZ\2040o\320D\023]\310\212E\257e\310\236\232\252\023\210&\230\024\014Q\221t\214\002\325\320EH\214\222.\032\324\200zt\241\003.\006\227\216\356\201"
+    "\301\243\250\354\012\322\261\252C\222\206kH<x\005\364\300\240\320\250ARGP\015]\011\256 sa\217\302\232(\011Y\254#\264\006\251MQ\020VR0p\031i\244\004\356\314XBF\200\204g`\222"
+    "04\235\346u\234\0250\261\030\320\013]8\000Q\205o\030\030\0426q\030H\015\311\323\036\232!\200\216\204bc~U\005]\3240K\250 \036\275\004<E\207\2412x\255\216\220\240\023\312\017\306\206B"
+    "\202\247#\246\250\343DC\347\000\350\220\015\226\315a\236\302\201\312(\205J\261X\354\240\334\230C5\224\217\376\004\212\01032\350\205\250\004\357-\320dS\217g[\225\352'\271\200l\217\012\300\240\305\241\032"
+    "\300\224 S\034\021\350#VGS\2124C%\305EU4XT\016\030V\241\243l\3405\014\023\355\017N\001\004d\024\274I/@\012\205\016\004\021\251\342\001\273\031]\342\230pF\001[\003}\260\035:"
+    "\007\370\306a\210i\011\352\002\372-\221\310]\321\325\204\272XG-\253\220{\025\366w~\317\201\314B\216\2051\213\236\026Ibov\364R\0323\202q\364\267\233P\000\217.\374\371\376\335\327G\257|\232"
+    "\024\320\3613\250\266\3351\207nx\360k\011T\0034\211\232\227\015cQ\005mG\3274h\265\006\326\011\220\016U\210[0\216\214\345\027\314\2250\331Jhg\0114\216\221g\212:\0005\343\232\002\352\011"
+    "\360\031\335\305\024\013\010\232A\363zS\304\211P\322\300\1770(\361\002\000\321\244r\035\334IE\017\204\017\376\230\242\252\324\361\023\331\023 \020U\327\134t3\364JY\326\240\224\201Y\037>1\333\006&u"
+    "\011\247{\011\020\242\357\310!\240\344\201R@R-\254/\220\242\256\251\264\326\002\267Ca\300\307\014\250P\024\254]aRh@\376h6p\264MU\0017\3224\014\201\006e\255Q_4\014\214k`\246"
+    "\323\302\011\022\201j`\246\302\232Q\207I\007\242\013b\017\006\241\031\202\001\272\211\256\261\364i\0304\006\232\262%\3265\346\3572\244\027]i\262+\3746L\252h\372\305\012\310\244\253a\034\236\350\303HS"
+    "\260\234\222\0338Y\327u,P\021\301`\004\351\345\371U\235\226\355\322W\345J\012\373h\325k\314f\253\322\274Qo`\221\336hRKb\332\302\272O\207\250\324Y\351\306J&\252t\015\012)H\222\220"
+    "pU\226\262\201;\314\316\012$d\005Hi::_\035\322\0228\042\310\017\005-\244!z\0159\241\3162\210\242`\262\004h\265\216\325\267Z7\201\224\202\237\330_t\250\353$C\001\237\322\015\254\244\001"
+    "Bi(\370I\334\016f\021\254\207eZ\306\213X\261\3130O\341\257\242\321I\011\353C\011\247#\314\313\022\272\200\334h\240\343+\015\232;U\010\015C\301O\274\016`\320:\226\265\360\227\204\214\204B6"
+    "\215EH\267\022\246/\2308\014\232\307`p\012\275\000\021Q\317\020'2(\247\251\312\2408\360jLr:z\227d\030O\302\362\246iE\023\036R\214\026\024\230\363\361J=\277\212.NS4\324Ip"
+    "\205y\032&\011\020E\243?MC1\301\363\353\370\211%f\355jA\263\200\355h{\035\326\031\032\026\267\200\037w(\347W!<5\015=\356\377\231\321\236\223\372\272m\365\314\220%\365$\377\266\310\254\262"
+    "\214\277\347V\374\334\236\005\313\306\207\346\346\346\003\313w\006!\011|k\241T\243\333fO\015\035\361\247\001n\231\261\276C1\320\2419\327\016\211\217\214\027q\367e\201<\315\356Zp\201;K-R\356\331"
+    "\347\314\362\001\342\332\335E\334xk\221:\331$\233\007\347\326L\237\254\333+'=\353\254\015\330\376Q|\034t\312w\201Hi=h\375\270\366\343Z\211<L\326\235~\333[\027]\317\242\373\134b\317\013"
+    "\302\276\271jCW\251f\255\266K\007\251\014@)\310Pb\315T\374S\316\301\271\271\316\260o!\001\322\035\232~\373\230\267~\304\014a\300\033\025\366\264\316\247;V1<\371N|%\346\301[\244c\272"
+    "\201}pn\223\243\352\364\235\220\032\2002\377A<\256\210zN:\030d\337^')\134\221&\350\266m\016U\364\372\336\300\356\003\205\230y%~\340\0103i\340\2716(\253[)'\264\211\023\020\212\321"
+    "\007=\226\243\275`\3273\333h\262JU\004\305Z\275\012Ol\223\002mNco\271^`\357\217?EiS\011\310\011\033\340\3726\240\366\273\242\230H\024\330\341\262\263j{\303\2602E\231\007\360y\251"
+    "4[\266U;\010\314nF:{\015\312\207X\304\320O\237i\242\270!Y\015\272\000\375\375\223\217?&\016\3608\033\203\027qK3\331gw:\244\022\273\306\267\276\225\370F\317\354\267]\373\007\301q\306"
+    "\264\002\244\252U\356\231\035s\252\211\207u\204\352\233T\236J!k5\342t\373\236o\343\323\015\001E!\003s\003M\224\354\273oRw3\203\215\276\225\214\2143\042%\225\216\215\215\314\267\203\001\014\315\134"
+    "7\235\220tl\264r9\331)\205\220|\032D\261z\030\243}O\010B\340_&\233\321\230\031\005TBB\001\311A\032@{3\030\324\012\205\000\225\340\257HC\037\3570\364\275\016\327(\306\341O\026\026"
+    "\026\200\337pu\305\366\313\251\006\370\024\202X\374\003\013N\371\325D\365\346`\340n\320\261'\206\312k\026\364:\272pet\3477_\336}\363\376\275\267\307/\375b\367\3637vn\276\033m&\337~v"
+    "\364\321\026\042f\042\031\026\243\324\367\350\016\352\221\015N\277L'86\220\262\222\212\014\003NnR\035L4\211\210W\205\304R\324N\342<\211\343\300\3612&\250\252\237\015\3156(*\312OO\223\363="
+    "\200-\332\326\3757\000<\016\221C\330\216y\262\301\013\206\266\373\200\3638\246\200\223\336\320\267\354\034\012^\370\303\001D(\035z\231\305\327\203y\322\255d\246\315\275\360\243\340\3705\360xN\023\332?fw"
+    "\217\231\033\230\007x\265\247\016\264\177\325\307\270E\352O\350\302\304\024k?\343\254\032\347M\250'\224\004\322}\333>GV\301\013!\211\221J\307\367Va\271\342\257\256\233\276]C\223=\005P\2425\030T"
+    "[1\256\004\222?\342{@\365\004>X;\000\005\323\0029bZg\343{%\276?fw\340VM\340\361~.\315'\344t\0244O\243(A+\271\217Z\216\242l-\242\036\210\354\366\351\037F\227."
+    "\357\134\270G*j56\016\222\214\250c+\331<PHC\212i\274\362\227\230\206\224\320\240b\307D$\236\310\231\344j\266\210\012'\342\253/S\362JVD\252\017l\234&\241\314I\030\221\220'$d"
+    "4\344\042\001\317\320\274\201\217j\300@\261c\272\324\371H\345\254m\017\210\347;]\247o\272\344\324QB\237\010S\203\0024\257A\275z\200Lh\343\000\0038\356\264a\206 \025-\201\210[\344\030\204\211"
+    "\247&\000\361\220\347&\354=\251J^\013z\336\326z\241\255u^\013\377\260\245c5\316\022MKE\273\177\373}JX\313\212\226\352h\212l\234\215c\022\2236N\265\272/\341\324\274\003\252E\016\250N"
+    "\023M\311\273\237R\350~\312\244`g\262y\317\267\201\240\177\014\023\017}\260\234\235s|(\316qf\364\254\341*\026'\220%\227\134\033/\217l\034mW\312\361\023MVKa\012{\010Q\252\134\005\202"
+    "\367\242\003u\227\217\317M\201X\031&\033\216\301:N\275\331\354\313\320\326\003\261\343\371KP)T\360D\322\302\241l\215\341\255\177\327Y\343e\263|\333\014\355H\274J\031\026\030q\205\307`E\272\375\363"
+    "\030\226\360 \004\26419h7f\343\224\035&\332\204\0357\017|\217\036\250\233\316\022\027;\345\244v\213\021\262|\223\203y1w\216\3761z\224k\037\364)B\236>=\022V\316\301A\241{8\014}"
+    "ge\030\332\240\037\366P\235\255\220\304\363\275<\335\002x\273\037\301\333\375<<\036\231Y\214N7\301d\031\355\237\341y\011VQ\0003\234\010\031;\230\366\030\235\234\272`n\003\237\134\3549n\273\022\323"
+    "\256&\312\002\033\341<\011+,\323\017i0\000/\351 w;OT\356\366\341\207\371\302\230\251\232\036\234\333\263\236\011\203\317\2529s\36015e\206\303\376\314I8\244\042^Y\243f\240\247\031\366'\243"
+    "\013\177\331y\341\231\177y:\321\306\346O\212\371M3\365O\276OU\265\007\012{4~\221H\340\012E|&\365\317\373E\312\270\232\323}\333\266f(\235\036\376\344\265\016\340bTZ\227\331)\221r\266"
+    "3c\013h\000z\201=\001\263f\272C\332/\344}\301\211\326\335{\226\2106$2\241b\313\223\235\031\231\3423\2639\250D*)\327\22558\005\004s\003`N\016t\006\200\026\343\271\007\350\235\004\304"
+    "~\027\2033i\235\212\306\207i\204\2274\345\220\314v{\011\027\301\307\234\000\034\311\366+e\013\226\272]\024\255\002k\030.'\247\352\3059\200\256\237\217\2022m\221=\325cC\207RW\342x\304\030\201"
+    "\331A\255<F\327\202\242\023<\202\313~\273\262\206\376\271\006\316(\361(Y\212\200\206\330\205\000\305*E\360\214\014\0018\361wA9\031\365\035H\023V\016e3\357\342N\177_.\016\340\323]\034;3"
+    "\356\004\015\223.\2160\2113=\314\2738:\177\201\325\360\370\026\032m/6\343|u\212\301\372\020\002\230T\246[\254J\004\042\363\210\331\000@\002\371\336b\203!\354>\0156\201\2629\241\372\177\012\375<"
+    "\374\317\245\237\031\271\035\134*7\367\362\375T\270\007@\360\024\012\013\013\212\224\000m\306\362D\225\342D\011B\321\343\263\254\325\244j\364\262\134\031.\333\021\252\026\355\232\015\274 \344NN>\301v\332*\321"
+    "\216\333\001\342\365O\016-\313\016\002V\261`5\235\333\004N6d\242\255\340=n\276q\247Kq\377-\032\355\252\035\366\2746,\030\236x\374\344r9^f\340\361Z\333\017p'\275\034\315\350\3022d"
+    "\2172\000\342\356\227\3036\304k\270#\307\255N\3608n\213mg\0064\317;\235\215xl\325Du\251\234\373\334\342\013B3\034\006\254\226\260}\337\3437\361f\356\222>\032\206\203%D\2107K)\271"
+    "h\273\266`\327\224\224\031^[\300\227sV\230\342\313\251\247d`\023+\360{\206\321&dbN&t\354\006\234\334\011D\205\333\364\335\344w\134B\237\275\233\231\337b\234\024`\263\300\341\370\310\314G\245"
+    "\327\351@\2043z\370L\004\002\342q\332\304'\037\006\224\344\035\204\213\014\307\304HW\244\011\017\332\236\360iq,i\017\243\330J\331\261\346U\257m/\322\311\276\035=\347\230\213v\333\231\207L\011\236H"
+    "q\371\261\363\347\210\355}\005\024\202\331\242\323ff\313\236\245.\363;\274\334\271g</|\341\342\370\367[\343\253\357\215\337\370`\364\352\037\360\370\361\225\033\243O?fG\221\267\337|\216A\356^\270\274"
+    "\375\305MJ\203\015\214y\033=W\315\215/\216\203\274\231gHx\370\311\245r5\223\014\274\263I\210MQ`\222\013x\375\243\333\305q\355\015\354\370\025\010\344\231\211d\024\304;\233:t\356\231\231ow"
+    "\260d\250E\361\263Il\030G\204F\036B\351\213\202-%h\272\266\037\026.&`f+G\247\274\337\375h\347\257\357}y\367\245\235\017>\335}\376\362\316\007\277)\343\2666=\021\3361\035 \016n"
+    "\357bECs\245\3315\235d\331\2659]\3119W\237\242\241\274~\366\354\265\223\234\201/\372\325\273\317m\277\372\313\277o]\341\035\354\357[o\203\013\355n]\032\277\370_\273[\237\357\374\355?&\035"
+    "~\232\037\375\237\317%\354AN:\237\374#Y\335>\0075Q\220y 5\272\373\331\370:\006\324\366\365\233\243\233o.\200I\307\257}\310\264P\031\337\276\260\373\326\255*\030{\364\312k\343[\027\027F"
+    "W\357\334\277\3632\204\331\370\312\245\361o>\034_\276\231\331Tq\202\0236\313hp\217\373\344\2252\006\351'/\216.~\230\217MF\340\177\266\236\371q\037\324\317\370\203\342y\011\276\274{\221\311\360\345"
+    "\335K \005Z\211\012\002`\343\217\357m\377\372\006/\012PJ\313p\034{$N\301\2443\341(\217\307NU\231L@\007\362O?cB@\371\324Q\226S\203e\357G\266\357U\012\253\322\2119l\257"
+    "\254\237Z\372\367\243'\227\217>\366\275i2\304\326\025Y\212\017\262\362\321\007g\211t\247\216fA99\347\262\362\306/\031\326\310\370\365k\211\315X\032\005\013l\277\365\327\361\313\357\215_\2724z\371*"
+    "\013\014>l\346\276\3028\213\2077K\275\233{x\014\010\311i\374\3213,W\215_\277\225\021\230\006\374\327*jf\013x*\267$\265amJ\353\270\354\221\205\342\011\245 Q\362I2\271\204\3221&"
+    ";\271%]$?\267+MW\000A\361\276tpdc1^\315VJ\361\326H\211\016;\331;t\330\236\241C\346#Z\260n\351w\303\0364\245\373\205\254\347\264s&Y&E\033\003iG\361\012I"
+    "*\320q\316\373\231\343\0377\001\373\334\327?6\306\213\356N&\243\341\3238\267\331\223\356\255\270\371\275\240\237\377\034\367\214\270e)C\3477}\212\360\323\376)\004\042\215G\016\235Q\026\314\035I\256\340\333"
+    "O\307B\235y0\304\351D\2003P\205\220\376\320u\253\011\312w\036\214\224\300&\233E0\270\330K\350o\322Z\354\042\3647u\023H\024;\037\274\277sckt\361\371\361\345wF/\134\335y\366\013"
+    "z\216(S\372\320\302\347 \246\025v\234\340\376\355\367\307\257=?7\027\331\014`\360lV\020U,\311k\217\255\370I:\377\366c\374\254\350\244\355\257y\374\013}\321\222\016\251\035a\377\236%F\217\336"
+    "v\2141\031\367\010\234{\371\253\365\300\007\367{~d\037?\252G\016\374\253\001\011\213\351o\010\304\244\217DhS\240\030\355\364\264rB9wh9&\230\357`4\322\303q\251\002\212\316\310\305t~\200"
+    "92\314\364\2403\360'\306&_8ei\042\343\021\323Jc\273O\213`\364\2279\372f?\316\2370U\276\366\341\356\365Ov\337~g|\355\371\335w\336\200\366\251\217\366\022\367)W'6\367\023G"
+    "\023\023\230\323\234\034g&9\362\256\015\363\336\356\257n\202\337\214\257\374\231\347\376\263!\224\244'm\327\266B\317\257\224\371\177\3204\203\177\352\2443\005\030_\332\202\232lt\373\017\321\243\221\321\257^\212\036"
+    "q\214>\372\335x\353\217P\000\216.<\273\375\327ksifd\011\227\317\303\031\021\017\273n\245|:\242w\346tD\356\014+\367b\354\344\201b\324\220n\366E\015\023\003\213[\273\371\2471e\3620"
+    "o\353d\227)g\333\235\347\336\314kw\322\266\134\264\316\320.\007\225S\357T\322|\230\316\240\315\203\355\235x\032\2473H\247@{'\234\006\357\014\302)P\216p\341Q1\366h\275\022[)sH1"
+    "\016j\302|\334nC\260C\274\202\225\247\257v\243|\313e\342j5^4\262\250\216^\022~\375\026\233\037\306o\374m\373\335;\321,\021\255\315Y\305\205K\264\314\3621J.\361.\032$\026\372L\341"
+    "\011v_\211W\300\303~x\0247\014'^j\217\366\016\361)\276\211\2570\263}mn \254\237\256\346\037\241\377\274\000.\022\017.\322\327\324c\255\007\231\277\313U2~\361\022\256\275\350\033\321\321\333\327"
+    "\237\335b\257^\263\027\272\311\251\243\311B<=\261\310s\014p\265\374\204\347\272\370XJ\226\342C\236\321y;\372\3575\026\212\317\345\035\214\246\310\134\244\000\002E\234\351n\263\342/,\2107Zt\347\316"
+    "i\034\214\316\017)U\222\2677,T\357\337\276|\3776\376\003!\226zY\032\206u+N2\334\211\352\032\373G\012\3635\372\257\026\377\0273\363\244\207\201Q\000\000"
+;
+
+#endif  // CALIBRATION_PAGE_H_
@@ -0,0 +1,104 @@
+//
+// This file is generated, dont directly modify content...
+// source: data/motion_planner.html (20773 bytes -> 5661 bytes gzip)
+// sha256: 3159eef47af05a4af99925ca5c16837a4375af0563a7feb3ab2c68a10904dac9
+//
+#ifndef MOTION_PLANNER_PAGE_H_
+#define MOTION_PLANNER_PAGE_H_
+
+#include <pgmspace.h>
+
+const unsigned int kMotionPlannerPageSize = 5661;
+const char kMotionPlannerPage[] PROGMEM =
+    "\037\213\010\000\000\000\000\000\000\003\265<k\223\024\307\221\337\365+Js:\317Lx\347)\026\320\262\273:@\213\205\315\313Z\320\303\210\020\275\32353-z\272\307\335=\354\016h.V\016c\201^H>"
+    "\201\016\011\353\341\220\204\356$$\024\262\005\006d\042\374S\316\314\354\362I\177\341\262^]\217\356\236\331\335\300A\260;\323\225\231\225\231\225\231\225\231U\275\263\217>ux\357\321\027\216,\240v\324q\347\037"
+    "\231%\277\220ky\255\271\334\231v\216<\300\226=\377\010B\263\035\034Y\250\321\266\202\020Gs\271cG\367\225v\346\344\200gu\360\134\356\264\203\227\273~\020\345P\303\367\042\354\001\340\262cG\3559\033"
+    "\237v\032\270D\277L!\307s\042\307rKa\303r\361\134\255\134e\204\042'r\361\374\372\275w\206\257\177\271~\355\367\303\363\177D\377\270\211\016\3716~\032\257X\263\0256N \303\250\317>!\264\344"
+    "\333}t\226~D\250c\005-\307\233A\325]\374A\023\330(5\255\216\343\366gPn\021\267|\214\216\355\317M\241\334\021\307k\355\0039\321\342^\370\032Z^X\012q\3404\005\346\222\3258\325\012\374"
+    "\236g\317\240\177k\326\233\333\233\361P\303w\375\000\236\326\353u\366h@\177\226\255nW\341d\205I;\203\236\330Y\355\256\35429DV/\362\305\323\256e\333\300\317\014\252\003(\252m\207\037\333c$"
+    "F\235\254\003\016b\372\266\023v]\013\204j\2728&N>\227\226\003\253;\203\310O\361\330r\235\226Wr\042\334\011gP\003V\005\007b\250E`k\012\177/\367\302\310i\366K|\375fP\330\265`"
+    "\341\226p\264\214\261\247KQZ\362\243\310\3570\2565^k\023V$t\316`@\333\251\243-\365\200\234\027\243.\371\001H<\203<\337\303\273\264g\245\300\262\235\036\010\263S2\036\253\260&T\2302c"
+    "m\233|\334\350\005!Y\306\256\357\250\032\211\0020\0050O\037\230\266\134\027U\313\365P[\345n\340\200P\375\322R\244\260\252\032Km\341\211\352\276}\246\2614\245\375,\371+\245\260m\331\3762\261\203"
+    "m\204\335:\374\010ZKV\341\361\352Tm\333\266\251\372\364\364T\265\374\370t1k\352\231\266\177Z1\007\215\201\352\322\016\333\2664\314V\333\017\243l\226\233I\343\326\245\020kQ\003>C\337ul\035"
+    "\200\317b\203?\301\352dNc7\036\237\3366\235\251\031N\245a\005\366D6\015CP\327[s\246\211\026k.\007\230\024\363B\272\034\260\024\333\353S;\253\260\030\325\235\305$\233\355\272a\351\245\310\357"
+    "fX\2732e\252\367NrS\303[\312M?\350\224\002\177yK1\2019~=SAr\310\234\315\265\226\260\033\317\251:\327\343\212s\361\265\235\236\236\326T\261\214\235V\033\242\312\366j5\241\213%\327"
+    "o\234\312`g[\0327$F\005\276\302\013\210\012l\304$\000\237\207\340\3326#B\205\330\305\215\210\354D\335^t<\352wa\363\362z\235%\034\344N\350O#\274\022\345N\304s\010\202\325\352\277\247"
+    "F\236,\373L\014i\276\324h\330;\360t\212\321\250\001\213\332\251s\206N\305\311\303\243\244T3M\277\321\013\271\024\354K\314\276\337\213\134\307\303\251A5\313\363U\357 \377\322cU\315\210U!\376m"
+    "\017{\260u\270N\030%b\272\042;\256\341\035\315\351,\275)\026J\002^\323%|\264\035\333\026\233\2219]\252C\264\002\307\216-\037>\227\300\311`$\302D\350^\307\203\231\352\315\000\325\370\177uk"
+    "\036\343\225\306\226S\237\270\345\304\253\306}LQ\202\335\2545\2272%\232q-\010\337\215\266\343\332\206*cbrA\3234\002\273\270\214\311\351\212\204\255\017L\275$\007\261\353:\335\320\011\305\360r\033\264"
+    "P\242\371\000\231NF\023>ad\265\222\232w<bo\245\315\304\271mi\241\034T\2653\323\273\236x\342\211t\335+K\242n$)\326[/\216\333\000\205J#+\352\205%\327oM\212\177\372~\334"
+    "\254\355\250[&}\134\307;\233\325\244-\3257\024D\332<\220\326\266W\223\036R\002\305\2536\254g\301\277\304\321\236\300r\274\020\035\364=\037\222\337\016\374\242\313\252\011K\212\200R\270\354D\215\266\271\307"
+    "\271\270\031\2513p\2146$R\251\212\251'7\206\035;v\030\241\236n\234\245\355\033\336\221\376\243\203m\307B\005%\323\336N\302|1f!=(dF\000\360\374]\022\206X\242\302\314 \236y\266\302"
+    "\253\217\331\012\253\215fI\011B\313\022\3339\215\032\340\252\341\134\016j\201\034+PfY\346>\317\011\315\362,\227\303\305\211Y\016\371^\303u\032\247\340\231\277\007\314\247P\314!\333\212\254\322\231\366\134\356"
+    "\377\276>\367\323\255\213h\375\336{\303\017?\032\275}mx\376\207\341\305\033\034\000{1\000AD\221\217\366\262\255\321\205\375l>\035w\266\302\030\211\371\202\244\335\261\347r]\253\205\217\222B+\247Ub"
+    " lm\222\010H1\031E\234\310o\265\134|\000\306z@\033\304\232_\360Z\260+\264u\026\230:\205\242\250.)?\3762\016\366Xv\013\037\004w\212r\363\263\025\030\232\177DBq6H>\226\223"
+    "\322\324)v\010>\345\342\335\015\222\317s\251\206o]\032}\375)\010v\377\307\2530g=FQh\021K\316%\010<M\236\316\217.\134[\377\364\315\373\267VG\337\374\365\301\225w\206\337|0|\367"
+    "\313\321\325\217+\243\353\237\217.\335\250\254\337\374\323\332\027w\326>\370=\233\342\247\273\347\207\327\356\215V_]\373\356\316\375;\347F\357};z\363U\206\361\323\335\013\134\230$\007\042\335\212%J\031\346"
+    "\371\217\002\002@,=#\254\323O\007!&t0\341\233\261\003\134\014?zc\266B\0075D\226<P\314\016GZ\244\217\210\312\331\240\302\213\312\367\026Y;\3469@\233\251pt\371o\303\273\027'\260"
+    "\325\003\204\177-K\317Zn\017L\004\226q\270z7\215\033\232S!-_\244\330\247\011\342~2\230#y\347\134\016\352\205Z\016\205\021\356\212\317\024d.W\313=\134\226\027\273\030\203\335?X\375xx"
+    "\373\213\365/\376\260\366\341eT\030^\374\366\301\352\205\342f$\010\011\035]\202\372t\216\3641\200\347rU\227\005\042g\003\267}\027\334\225\001\242\377D\242\215\223\042\332\246\254\134\017.J\311\253\204\224\020"
+    "{\366\242\342\231$V\022!\000ja\0057z\021f\243\302[\205\267\353!oC\301\030\366e\036>\374E\276\235(\263\355\266m\361\024\346\272yg\370\372'\303\3637\206\267/\016\317\277\237\210\260R\013"
+    "\233\213a|\002\021\277\250,b\212\211\361\213#\363\330uuu\370\331\007\214O4\215\356\337\372_\021\244\336\004\223!1\355\353OG\253\327\356\337zcx\361\335\265;W\206\347\256\257\377\360\375\350\352\355"
+    "\341\225/\357\337\276\235\134Gu\212\003\220\350\347\004\007Z\372\037\007\355\215Y\300\226\334\200\317\267\037\364\307t\263v\367\362\360\342\315\015\373\002\255\3634y\366\013w\320\254}\355\322\225\265\377\271\275\376\032\321"
+    "\334\332{\037\217\316\277\363\220\035zw\267\013\326Mv\337\037a\225F_~:90Z\024E\204F\005\010\300\374.1^\021}\232\226\033\342\034/\024\261=\317\002\306\332\3337FW/<\370\357\217\251"
+    "I1\214\261d\242\240\207\005\207`\357\014st\365\253\341\215\277\247\341O\010\326\377\232\360\220t\326E\3451X\311\305w\037\254\276\232\356\252\033\212\014\015\027[A\3124{\325\347\340s\267\316\201\301<\334"
+    "\220\000\264{\042\036p\345\323\274.+\036LV\244l\335\231z\204\274\134\325!|\315\315\257\375\345\332h\365\363\341\253WG\327\377\274u\335\375\232Ha*\216>\214\265F\243\2230\314\207\243;\250\336\270"
+    "\346\326^\377\001\362\262\321\373\237\017\357eFRY\362\361\340@\277\037\200\257\363I\006TNf\303F\340t#\024\006\215\271\134\205f\261/\365\234\362\313!\315]\350\330\274\004cdN[\001Z\306K\213"
+    "~\343\024\216\366Z\001\215?\307\002\027\315\241\334r8\363b\345\305J\016\375\034-;\236\355/\227]\277a\021O+\023\375\222\363\027\030\312U\032\035;\307\212\026\027G\204Z\250Q\223C\224\245c\216|"
+    "\320\350\005\001$}$Q\207\011\363g\332y6\006A+\214\320\301\335\317\277\264\270\360\353c\013\207\366.\274\264{\357\321\375\207\017-\002\330\264\304\027q\223m\227!\014\036?!G\003\037\012\271\275V\227"
+    "<?Kc\356\014\312\267\361\212\225\237\202\361\326^\222\334C\305\205\006\022\0057\233\0204\234\323X$\261\207\273*e\012\327\354yt:\004\305E`\037\360\227\367XQ\204\203~A\226\201\001\216z\201'"
+    "\344EO\212O\345$\312\014\242\001R\224\231\364\227\025\366\275\206\234\307\365-\233\210\241L\020\005}\245\272d\352\012p\330\005>\255e\313\211P\023CET\310W\254\256Si\000.\210|\0265\254F\233"
+    "\350\300\363Ka\344\0078\217\006\305]\006\025R\336\305T\010I\260\037\222\355H8\247\211\012\134\236b,\030\354\007n\2372I\010\030\320\224\346\317~Fi\227\351\252\024\025\356\221\134\2502Y$\230]\002"
+    "\262'\257\274b\300\354J\305\026\213\252S\210\237jT\304SIi \352n\320\023\351@\024^R\271\254T\220\323\362@iFu\256\330k'i3\034\370,:\205\373\240x\010\212\313`\000\260\030g\332"
+    "\360ux\341\255\365{\037\3027\354\301\267}|\020\015\246\322\321\232V\030\305\250\367\276Z\277\371\256\201\212\366\021\210$>i\015i\363\276\363\366\203\325U\201\274G\214&\021\211\025\223\316K\214x\363\213\365"
+    "\037\277\026\210G\211\215\037 \303\351\230\001\351\027\305\250\027\2777Q\237\241\343I\334\260\3554#c\332\265kw\004\356\042\031\316\232\227\342\232\023'\220\263f\206\255\242\263$\020\327\316\177\015y\274@\334K"
+    "\207\222(\201\017\341\031\257\010\244\321\373o\200\230\317\013\254g\350(z>\023\261\257#\276` \276\220\211xFG\374\215\201\370\233\2645Yv\244\001\215.\134_?w#^\017:\224\242\316\310\362\354\245"
+    "\230\311\341\337\317Af\036\353\222\017r_\020\361\2219\003\251\234\263\035\241\321\207\3558\214\311\322\336D\254i6\226\306\014\356\3068\254\365!Y!CI\024\333!\0224\260\300b\235\022TX\373\356\373\242"
+    "\300}\212\303\240B\247\230B\302\042U]\214\177\355\217P\363\242\302?n\304\350\273\3118{\222\252\210\347v\037\370\325\376C\277x\351\340\341g\027\310\366\345\341e\264\210\243\202P\211\022\024\014GW\374V"
+    "\300*\016\251\272\230\030V=Gs\005\001\300\014\234qYT\367\332#\207\027\217\036{f!\311\245b\340\212\311*F\030\233Ul,\204\262\276SZ\256\013\373\204M\332/!\304*\261\271\026D\304\374\025"
+    "\356\313X\013\221v\355\366\027\243?}L\333\200W~\272\373\201\034(!p\311\365\277\336X\373\356\016<\277\177\353-\326\334b\313\002%e\334\356B\314\302*\324f*\302\014TBq\213\214\0202\3208"
+    "\034\331\2734\305\224\333V\2501\255\356\020|\323?.\214\373\204\336\310e\3444k\330\024\271)\351\000\322\254\023sd010\026\244\351\270\220\177\210u\010\367\260\255\233\225Q\241\266\024\303\017?\204z|"
+    "x\356\356\360\233\277\201\246Fo^ \265\371Go\254\337{mt\347\263x\005\324\346\343\203W\357\015\317\275\265\376-)\202\207\337\336]\177\355/\260\333\014\337\274\134\031\275\377\311\350\322\371\237\356^\370\347"
+    "\352\357\024\235\310<\015r\0043\027\230\203\274\360\267=\313\316\027\023\011\017=\275\305\266f\255\206\0071{?\241\344#\134A\134\3242SD\301Gs\363\350QN\220.\213_>E\026$C\277\034=]"
+    "\271]\277\333#}\376cq\363\260\2408\000\254s8\205\272\001nbH~m\332\377\223\262\311\340\3110I*\3437zd\225\312-\034-\270t\301\366\364\367\333\205\274\204\312+GI\004\237O\007*Q"
+    "\224c\360`\240\200D$P+a;\326\015\224\024\240\035I\223\351\247\033\351\032\222\334\224\035\317\303\301\323G\017\036\000\202\204n\271cu\005\231\223F]\377\330YNi\220\233\247\237\217+E\301\211A\134"
+    "\333\237,\226_\366\035\257\2207e\365\360\012\221RW(\261$\203aS\343O\232(3\210\360\030\036\257\236\2001\376\2110\206\344~\225&,\225\203\252y%\322\354\201\261G\016(\216\302\020-B8v"
+    "|\3401\003\273\014\333W\224s\017\261\261\034\364\251\236\216\000\005P\247\2623%N\030b2\352AC\2745Rh\304\3003\250\220V]L\344\241\2366\304iI\017v\001>'\323\0149\017\004\347\265\022"
+    "|\251\275G)\231\322\202\214w^\346n\242\357\221BC\227\213v\042'\366 \005\365c]r\2525\315\031\014Q\027\007h\211\024\006\312<\262)\022\317\242\366F\004)\332`\020\007d\012\272\350\013\304\310"
+    "j{@\311\262\240\374GP\377\253\230\352A\213\241$v\336\042\255\210\001\231\310$\014H\246\225\023\2218\015\023\213\224@\245\356\042\325JO.\004\026\0353\021\350\201\201\234,\355\334 \226\226\200\322S\345"
+    "\300\2611\342[\222\345\026\0234\343\226\251\024?\255\011\033\023\346\360h\377Sc\250\262N\250\341\012k\327/\257]\372\134\020b\335~bxD=\021n\365\025\042\346i\200AI\367L\016\251\243+\355}"
+    "\211\254w\371c\373\267mb\242a\322\376\215\316\243\324\220\322\200\224\212\361\354\014\032Z[Qr\243t\027eu\004\220Y\234\320cva\341J\033OZ\270\337EN\207\036\256G\330\355\2470A=\310\344"
+    "@\351\324\351|P\267T\250\260\323\355\030=\375tZ\220\310<\326V\010\262\356\367an\2452\212'Z\333\202\250\000M\260\306(\031f\227\332\345\216W\235\302\022\326\004-\266\351\2309\267\310B\3306\245"
+    "6\217\364n\305\344<C\207\224\233\340\230fYz~i4HbB\372\004Z\372\2205\307CO)Ru\003\014\030\274\261\335\376\225WP!\2133\226?\214\031\0259\205(\227b5\214\317\033S\013\247"
+    "\342\024\362z\256+\3717\330\365\275F\233\264\331A\0200\000\320\225\231C\223Df\017\206\254\031o4\323d*0\333\206\235\323\031\272\222\200\233\021\3574\010&Y\223Yx\234\177um\240$.x\320\374"
+    "\252PL\317\306\311\315\377\347D\207[\361\202D\237\232\247\312\0226\255/\036\263\222@\007]\373\340\231)\232f>\016\033x!\377\334\042\321\227GO\302\362JU\042[\274e\332|,p\032\203\244\350i"
+    "\0237\134?L[ccf\002eO\221\032&\350\303\366T.\227U\036B\034\035u:\330\357E\005MgS\250^\255V7\306H\007\207\241\305\314\015\237&\3669\216\237Y(\355\320\317\021\005,\033m"
+    "c\275\301\035[YH\316\011~\271x\370P\271K\336\012)\244\342j-jR\011\210&5\270\202\355\342\347\302\203\214\313\002\220+\352\235hQ\340\251\304\006\361\347\364\316p\2627\254\364\222\323mR\352\201"
+    "+\314\014\316\220\031.\270\343<2>\0242\313\241\010\226\220[\362S\340\042`P\221\177\300'o\275\220\305]\214\002Xx\331\315\247\363\224\311A\364^\366\366\005\240\236<\376\330YBep\002=v\226"
+    "\3637x\321;\011K\225\000O\027\217\034\342\035\261\372\304\250\013]\366{\012EVKJI\026(q\026R4\224O\200\222^\012\353\231\264\274\000[v\177\221v>I\307 \266\335\362\341#\013\207\324\305"
+    "J\242\022f\013\324\244B\252\034\247\331\027L\027\025\243\222Kv\022L\027\254\032\224d\265\310N\220\347\320\371\001<\313 48)\375\007a\027\2345\313)<?J\013\021\203TE7Hb\322\210X!"
+    "D\305\311\334\3467\263\301\353\221[n\024[\333\042\030\276(\223\251\337\356\003\245D\205LZ\362j\223\240e\0309\2759\264Ab\362\226Q\202\0301\260Gc\005\301R:\341!\353P\201\001\221\357\214i"
+    "\210SU\325\206\302\266\277\274\033\022\302\250\240\235_\316\261\023L\330\374\363\353\337\336\034~\372\325\360\017W\206\357\234\037}\177)\256\225\357\337z\233\227K$\0018\002\311*X\002\275\216\014\3051L\346\210"
+    "z\030A\244b\263\347\223\275+\262\343\233})\255\357\223\336\364IO tepp\3320!+Z\334\254\334\237\013Ay_p\370\343\177\015/\274\245\325\227D\364\243m'\224\246i\3738\244\206\037\366"
+    "\272\344]>\024\265q|aDv\013\242\315\351\202)\222\034\375\212\211\016\372$Y\027\337X\2061\305\027y\240\351\201\031\0025\035M\005\214h\231\016\3049\375\034\263\307\214V!C\311\330\007\3705/\021"
+    ",\331w\323\205y\020I\021\205\263\243>\224\202p\264\343\034\210\010{\202\234\354\262\257\232\213\022\231\323DSE\347\344\022\262\247\341e\250\202\223\310\3364\364\013v\206\032\342\005M\213z\272\025s5\352\333"
+    "\211\251\314\014\345\013\360\324M,\317:X\371\214\1343\365\346\236\266\351\0317\026\312.\366ZQ\033\315\317\245\336v\330\234\367\261\222<\331\346\242\036\367\202\337\203\354\205\262\010\331\263\326\332J\272\325\004\217\332"
+    "\342\002\230\262w{a\333\324:\010fc\345\212S\272\236M(3{\042\357\377\214K\236\224\353\203y\215\363\214\345!Z\326\266\0002\203V\247\236\324n\360(/\001\220\0224k\301F\037\374n\364\376'"
+    "\312\042\035\362\343vc\037G\371\001\273\333sr\322\362$\2701\305 \3052\3274yI\313\306+\251\305 \211#\007\350\325\3009\3632C\271\011h\242\340\346\3455\225%%\004%\356\224\220\320#\350\352"
+    "\007\014ci\322\015(Qh\302DGY\313_\262\373\244\374\254\325\372(5D\246\261\307IJN\237\224\2373H\222q\223\024\215\202\234V\352^\361$X\012}3\212\233\012\344\220\304B\322`!q\337"
+    "\347\254`\273P/\016Vf+\004k\376$\261\222|b\027<\251\024#\331\206\250\3259\224\013\230\231Z\003\244\366\265A\231\244\373\134\273\003>_*\212\320\327X u\233\031\003\250=B\300A\254\301\201"
+    "1\264\201+~\001&\374\363\355\203\2136(\216\363\300\341\371O\036\134\371\214\372\3363\024\231\370\234y\271\220\316\236\220\300\270x\033;\351\300<\250J\006/\205K\356\214g3Bd\330\005\3110\203\232B"
+    "\265M\206I\343\272h\326,\312\265\271\215R\326\257\273nd\207K\204\320\215e\321\347\316\363\346\267\014\222\244\355mA\220\207\3449\202\265\307\342\010i\203\273\230q\327z#\373\304~\275~(Cy\327)"
+    "\030%\011\253\342\236\345UN&I\365\336\264\240\307\204&\027\234\363\2732XUb\272\340\033\312\023R\340\227=\177\331\344EI\030\225\356\216</9D_\302(\310G\305\251\004\334L\352&\042R\200\371"
+    "\254\354\251hv\211hj)u\223\226Q\262a\340\226\250\300\134\264\2144L\2344\214\263Oz\215X1zI\350,\012\351\241\004\231\020\015\350\315\012\277\233EK\2758\234A\255\241\234Q\3044\345\303L"
+    ".c\027H\264\201\222\035\042\241\030KCH'l\276\377&\363#\355\302m\226\343a\217:Z|\035\027%\017\023\306\207\213\261\015\332\214\033\244\214RV\300I\245'\337\375\025\356&>p\237\243o\224\352"
+    "\202\3562QL\017\215\017\347\301=\365\306X|\224_\216a\264\324`\042\351\304\301\375\230)\022\260[\237\352iZ:oh&\002\272\311\211\324\343\372q\263\250p[\233b\222\034\012\330\346&\220\307\370c"
+    "\310K\240\315\021\027\207\374cH\013\220M\022V\357\000\214\243\256\302ma\012\322;\232D\236\300l\2014\273-0\2016\005\332\002qz\225`\022q\012\264\025\342\361\3369q\206\030r\013\323\260\303\336I"
+    "S0\250\315\2217o*\214\231\303\004\335\364D\312\235\206\361\323(\200\233\236D\275\3600~\026\025r\323\323hw\042\306\317\243\201n^\036\232\222\214\225\003 \266\306?\317J&2O\341\306O\001\322\005"
+    "}\226\026\370A!\257\376\015\207\304\004Y\371\006\1779\237&\035\367o]\037]~-?i\036V\243\035O\376\001\203\023c\304b@\251\362\250I\374\344\033\021z\026\037gf\312\323\262/\317\373#\326\017"
+    "\220|\350\327GR\371I\245U\313\244\225\031\001\314<J\350I\371\353B\306\233]\001n\222w\261*y\215\000\007\363=\321<\325^QR\350\211cWX\355\000C\312v\204}/\310\264\277C^\273!"
+    "eH\336\370C\013yY\205\200\302\211\0203\374D[\221K\302\320Dx\2377#\323\350\270\002\337\2453c\344\226\310\274\023\020+\235\276\364$\317\342M2ad\005\321\021\337u\311\031j\255\252\236\212o"
+    "2A\246\345\221|)o\266\302\376\240\307l\205\375M\304G\376\037\2036\346\322%Q\000\000"
+;
+
+#endif  // MOTION_PLANNER_PAGE_H_
@@ -0,0 +1,239 @@
+//
+// This file is generated, dont directly modify content...
+// source: data/web_controller.html (60360 bytes -> 14331 bytes gzip)
+// sha256: 3b9343d20c71f2e51aa9cfeb7740bf8a3d3890e4cbf157ceeff7f2f8694bd264
+//
+#ifndef WEB_CONTROLLER_PAGE_H_
+#define WEB_CONTROLLER_PAGE_H_
+
+#include <pgmspace.h>
+
+const unsigned int kWebControllerPageSize = 14331;
+const char kWebControllerPage[] PROGMEM =
+    "\037\213\010\000\000\000\000\000\000\003\355}kw\023G\322\360\367\374\212\301{v%?A\262\356\222\015&\007X\310\362\036H\330@\222\335\315\223\2233\222\306\266\026Y\322J#\033\330p\216\311\306\001\022\256\271"
+    "@\000g\201,\004\222\015\227\334\2005\006\316y~J\326#\311\237x\177\302[\325\267\351\236\351\031\311\134\222\354{\236\315b\217{\272\253\253\252\253\252\253\253\253{\326\257\371\355\313\233w\377q\347\026\343w"
+    "\273wl\337\360\334\372){\272jT\315\332\344\370\320\376\251!,\260\314\362\206\347\014c\375\264e\233Fi\312l\266,{|\350\325\335[c\205!\362\242e\357\253Z\370d\030q\273bW-\343\257\344"
+    "\017\303\260\255\275v\314\254V&kcF\311\252\331Vs\035{\323\250\267*v\245\016\345M\253j\332\225\031\213\2769@\301 \002\261\326l\305.M\2555\342\263\225\211J\254h\327\340\021\372\266+\265\311"
+    "\026\373\263\001\025kV\023\377\022\235\026\315\322\236\311f\275]+\307J\365j\2759f\374*\271e4\261u+\357\233\225\316NUl\213\227\025\353\315\262\005\205\265z\315S\026k\232\345J\2735f\024\032"
+    "{\005\366f\271\014X\2202#\231u_L\324kv\254U\331o\215\031\311\214[\134j7[\330e\243^\221\231P\254\357\215\265\246\314r}v\314H\030P\337\370\325\350\350(\177k7\315\032g\222Y"
+    "\255\032\211x\272\2450\011G\006\3603KX\247\025\253Z\023\266`\202\313_\263\330\252W\333.\245Xm\314H%\134\354\354zc\314\310&~\255t<QoN\217\321G\030\037\353\217\321\030\324\030\346U"
+    "\312\225\026\260~\337\2301Q\265\004\234I\023\340$%\300d\344c\300\345\351\226:\376z\002\232\225\311\251A( \365~!$\350\004P@\256\324\252\225\232\025\223;\010\204g\030\177n\267\354\312\304>\020"
+    "Z(\255\331\336\327\004\265\034\307\314\257'cS\365\031\253)i\213(\220u\206\026\206\351J\242\230/\227\315 \042y\373\220\226:\334p\210g,\0319Q\242`GK]\364\024\005I\241\202\344r\271>"
+    "\203\234)\360A\326\240\377L:(\266m\273\016\343o\004\010@\261Z/\355\341@g+e{\012\204,\215Rf\214\374\227\32192\327Y8\3229zd\345\303\033\335s\357v\357]X\276;\347\334\270"
+    "\357,~a\374\327\010k5eQ\241\317\206\266Z\371\347\247J+\322\273\257\351\362\375\207\235\323\207:\013_;\177\177\247{\376{\347\233\371\345\273\327\335F\222\015\223U,\300\206\005\233x\362\246l\225\352"
+    "M\223\352\261l[\353m\033\221S\013\271 MLL\254\013\026P\325\230\017`\270e}V\007|T1\271\312hrA\017\224s\265\266W\256\302\365\312\213Gv \301\203\011B\310\035\371\005c\331\275z"
+    "\317y\377\232\020\203\225\317\027zG\276\355\335x\320\275\177\203\217(C16]\017Gp\353\326df4M\205\353\373\017\272\213\237\003$\016\343\200\017R\010\177\266n\315\215n\312h\232\364g\022m\372\264"
+    "\231\344\134}\330\231;8\020\223`\326\261\333\315>8n\314&\022\353(\367Ou\336\237\353\334:\357\234\377\036\000w\276<\033\3103\0068\224m\233\322\231\274\276\325 \234\303\326O\235s\017\346;\013\213"
+    "\235k\227\234\245\023}8\327\262\315Z\271\270/\014\307\364F\374\217p\316\271|\265{\372\275\316\231\213\313\213\213\320C\367\340-=\333\030\324\020\266e6\342\177\372V\375\331F[?U\266\211\261\263\232X"
+    "\331\254\225B1\310m\314n\334\374[\215\005\222\001\204\320\237\337\224+l\331\022\334\262?\017(\204\247\313\203\311f\245L<\031\023\254|\323\357\032\341{\341\331`]\360\210\032\010\014\261jO\327Z\2700"
+    "hX\246\035M\2575\222\023M\341\266\0217H\236\227\270\333\244\365\251B\334\255i\2639Y\251\305\210\347\350\302; \241\217\315bI\230\326\0311\210\327\230\321j\2305#\271\316_3\245\255\231\322\324L"
+    "kk\246EM`\205\015\212d\314TZ\225b\245Z\261\201aS\225r\331\252\251Ub\315\372l\020(>\353\023\322\204'\344\312E\254e\021\267\333?4\362L*3))1\211\333\207\225\271\013\340p"
+    "t\216_u\016\337v\216.:\027.t.\336\001[!\214C\253aYT\020\232\365\252\350k\332\334\033c~\020\230Rw,iw\264+\303l\333u\337\202K\231\313\375\242<\221\305\377\202\374\200l\220"
+    "\037\200K/p\255\215\346d\321\214&\326\032\354\377\361\244\352\347Qb\252f\321rI\221W|\005\317Bp\226\215A\261^\025\302.la:\355ar\261\016\272;\255\222\030\344]\035\360\014\300\245\177,"
+    "\337?F'8\355\000T\255\031\253\332\362\217\265\2744\031d\375\221\324\015\026\332\210\204 \034 \306f\233X\031\177j\370'/\225\224qU\324\232\373u\350\223\303\362\257R\3669~\276\321W\026\364a\336"
+    "\242\220\210T\266\257\177+\217on\200\361\325\255\332\015\313l\271*\005C\315d\277\3405;\202A\375\227i\375C\032\001\253\227\224\260\325:-(p-H\203\002$3\231\265\300\243,\252BZ\247\012\200"
+    "i\274\377\3742H\364\305\273\014\313<&\036\253]\337r=\352\134\277\202.\242\317\220=Z:\354\034\373\204j\326\243\245s\335w\376\345\034\272\347<\370\252{\374\246s\370P\347\330\347\217\226\216\010]\233"
+    "4+\366\177\274\255\223\254\203\264n= Q\370\2132\200\316\371\363\275\333\337\321\341\203\001B\372\353F\347\332W\316\311S\316\335\2779\337\314\251\243So\220X\323\323\265\204Z\233\027<y\272\330Pl\237"
+    "0nD\320\321\005'\211d\311aH\215MM\025\314|&\353\2272u\025.4y\042o\2463\001\042\007\353\350\276\326\264\335\202\006-\253\012\276\207\352h\254\302\236\246d{\352\347f\245\326h\273QD"
+    "\263\204\314\022:\243\222\313C1\222]\347n\223\134\30655\021\320e\260\011\364\365\350\213p\270\026\250w\363\223\225\257\216v\346\256:Ks\316\374w`x\226\357\3153\351\376\364A\367\362\242\317\322X{"
+    "\301\237\253L\003}f\225\272\202O \324\375\004\314?\363S\301\366\361I\250\2617VIC\201\232\370\256\272\0030X\370,\233\362\217Y\252\240\357\221I\004\217\316\325\033f\211\270\324\011\017\314\204\027\240:"
+    "\340-P\030ij\011\216O\007E\312\220]\242\017\032\206\027\1776\225\036Q\267(\023\335\002\377\004P,\026uZ\002\012\322_C\025\232\306\212\026\370\011\326 \244q\341\031\032\362q_\032\021\306P\271\210"
+    "\322\233\226\215\021\2450\0356\311\371\035\232\276D\212]\000\215\020\214\225\246\254\322\036\253l<\357\033\316>~\313@\300\274|\324y`\177\210\246\344\3252\201\352\327f\234\366\2643\254\274\251\344\237H\003\254"
+    "\250\264^\273\364C\357\335s\335\373\337:'\217y\026\012\023\365\272-\361C\326\361LB3\273\244\264\336\311\030\2119\233\315\330$\216\007\020\023M\246\263ekr-F\021\362\226e\032\211_\303s>\227"
+    ")\232)0*\322\206\214v\310\003\243\313\232\030/\375\221\220\225Hv|b\003\256\362(#\270\235\324\371q\005\235\037\227\220\2348\025\222\272'\272\332\005E\240s\244v\002l\337\3634\334\232\254\326\255\251"
+    "\325\003\035\233T0>O\333\263\011\224\220\240]\206\000\315\011\334\276\225\345\230H\011Yt\270?\300\371\030\016\020@e7\262\337\316\255\304\243\300\005K\020\006\351a\245\233\307^\340I\012\220\322*@\245$"
+    "E\207\270EOh\246]M\134\250s\355\022.\247.\275\34712\323\365\262Y\015\0179\271\223\317De\257%\324`\177\254R+[{Q\001\022A\223\250:\303r\357.\341n\013\013\357N*\363\033~"
+    "\306\036\362_<\253\362\206\020\340\263\015\272\325\231\205\377y\215D\366\327\372\245\236.\362\221t\275\364B\241\020d\367\262\276Yw\324\245-h\355\351\027\013D@%<\255#\234\356\330\257\322\314\264\300\341\002"
+    "/\316\262g-\2536\200\332{,^\312?\373h\227\212\2143\242\231>p\244\220\023h\231\345>\007_\3112\330\245j\275\345B\345\265L\323\134\247\351h\240%\263\336\241Tvw}!l\202\205\307\272"
+    "\210\030HBum\321\210\304P\200\033\336\371_0:\3533\363\320D\215\004\350\342\006>@\336d\231\3250v\242\322\234\2365\233V\014hj\201\211\210\025\315\362\244\0258\313(h\2506?\345\023\033\355"
+    "*V]\017\247'2\023\271@\034\325\331&\355!s\302\234\256T\001\265\351z\255N\364!D\333\255\254\225\267\212~n\253+[\215y\323G\216\374\213\376r\271\034@}\377T&b:*\373I7B"
+    "\3434\242A]\344\211z\251\355z%\332M\177\006$\304\351&\360X\222P\270\351\011]\251\3724\244h\327b\015p\271\315\246\273k\211\320\000D8G\237Q\202\331\323\016F\373\311|\254\354\037l\337\002"
+    "\007\253V~\012\214\222\266\022\177Z.\351\210\351\317\216l6\353k^6k\223r\034`@\312\313\245t\326\027\010z\266\304g\364\212 #\352\263\042>B\3733\251THy-u\2456QG\273\020\326"
+    "\314\312\203E\235\360\020J=\272L\320\246\217\226\331J$=\321\237sZ\0261\304I~\332_\134r\203\027\240\372\355\257\247\022\274\367\316\265\014)MT pZ\221i\224\0033\320Q\254\330\264\314=`"
+    "(\360\027\320V\015\227\021\036\371\260M\273\335\212M[\255\226)\315\271Ar\0252\025\255b\262\321,\020TtZ\355R\0110\012\023\263r\306\222\362\256\204\301\316f\363)O$[\231\204Ki+W*"
+    "\352\372\264\232\315z\250>L\024\312y\177\217\371T\262\024\332\343D\266\244\364\270~\204%V\257\037\2419\330\353\213\365\362>\222q=\2254JU\263\325\032\037\042\036\354\020M\276^_\256\314\360rMn"
+    "0\253\005\365X\276\042\253\312S2\207\214z\255T\255\224\366\214\017\325\033V\355u(\336\305r3\243\303CF\331\264\315\330\376\251\361\241\377{\341\243\333\306\353\225\255\025Vf\325\344\262\015\342q\375\010\355"
+    "'\240[9\357\323\323\365\313\366\224\325\324\366\375\343\271\263\217\356\2360h\006\222\324?+\347m\2066(\025\373`\042\345\207\016\031\225\262(\330\344Cl'}\201(\021\306\217\017\365\036\236t\336\277\326\273"
+    "\372\256s\370\303!\303lVL\352\024{\337H\334\273z\335PJ)\377\240\224AG\026\212:*\352\353G`\210\331#I\364 \330\202>\356\246b\320YXt\316^\303\224*\262\221\011\022\004\225\372\012"
+    "\007\211=\007I\207\224\305+1\303\256ONV\255\355\360\256\015\275\003?6l\251MV+\255\251\000|A\204\223\3447bA\220\256\317\002\203\321}\337\001\272\003\275\263\252X\207\332\331\015\224Bb{\307"
+    "\207h\331\220AT\002\372\367\233\345\000\367_\030\042\2646\252Y\204)\317\3579\001&&\357\205N\216)\262r\346\261\003\222E;dL5\255\211\361\241\221\022\340P\244\221'\256\204\214}H\344\346\215\333"
+    "\267mze\343\356-;7\276\270\005Df_\003\200\322\367\022/i\001\371#jOUZ\303\353\206\302\0200h\342\360n?\007$)\353\134\274\344\034z\357\321\3229\334L\272\372\201\361\266\261\374\3603"
+    "\347\372\247\222\310mvQ\0373v\331f\323\206Z\273\314\031\024\243\200\326bp\327\217\230\033\230p\255\037\341\303Ul\322\341[\023\213i\362\202\214XL\010\000\267\000rn\220\306\206I\3516C\033\250:"
+    "\311pee\360\267\042\011/AB-\262\006\030?\310\337\343C\211x*+3\361\357\007;\363\237K,\333U\005\251m\201\260\3227\375\014\134P'\351\264\334\311\374\347@\224\247\023\350\201\024\017\332\203A"
+    "w \275\035\311\304,\337\275\256\366\263\303\202Yxzh\003}\361x\264$\343\011\251\013\347\341?\325.\266\232-\233\360\213\276\011\264\015B\363Qt\374\231\030r\016\306\362\342\345\345\305\017\00321\316;"
+    "\363\327{\267\277s\316/:7\316\255\334\373\264w\3432O\0148\242\221?9]\203\032~,\331\034(\217n\362\203[{;\225N\2064\311\223\225\345\022\011\362m\343\236\363l\3652\3244\235ywx"
+    "\335~\267Ho^\301\027\314bp#H\034&W\374i\240\206\017&\263\346l\012\223A\031\010\333U\033hI\203\016\324t\221\015/\360\352\365h\354&s\202\334\226\030p\336)\331!\033\332 \317I8"
+    "\366\0043\361\247\334B\277+\026\3207y#$Q0X\022F\271:\230\023^C\231#\373\216\034M1`\272\2612w\244\363\301\227\301\243\307rM\134\214_f\005\033\274\262o\030^\321T\322g=S"
+    "\013\253\303\376\362$\256K\231\253\322\034\323\262j\345\315\365\351i\263V\216\216\312\016U\347\314\007\275\373_\377A\342\323+u\033\267)A\246\351+\217\326>\035\034\222\011?\022\177\364!\361G\216\304\037\237"
+    "\015\022I?\022\177\362!\361'\216\304\237\236\010\211t\020\022)\005\211#\327{\363\267$\034v\317V\310\204C\312U\004|B'r\202%\001\343\325\264\310\366gQFF\316\271\363\005\260AF\256\335\254"
+    "m'+\013\372\312\303 /jJ\1772\212\217\213]V\301\356\304w~\354^\241\256-}\247c\337c\366\254\014\032\314n\275;\247d\301i\327\310\234\007\245\253\220\031r>g\000\251U\272>r\254\367"
+    "\360\274<\345\326\233\263f\263\014\335\2237\203t\337\277\313\202\334e\367\360\327\275KGeG\262Z\231.\016m\240\345\003\363xuD\347<r\330\275zOv\231\246*\023\266\020Dx\267\012\256\363c+"
+    "\375qPL\026=\030#\343@\341\000\006\344\315\323\037\367\274G\3305,p\245}u<\360`\020d\252\322\012\006'\217\257\314\315I\030l2K{\230\350\221Wr\377\222\213'\031\005\315i\004\266\376v"
+    "_\3544k\226\326\027\323M\220\375\214\262t G\341\267\247\317\255M\313\042\356\224\032\000@V\354tkq\256D&x\365\210\314\237\336\241\257\272\037\177\343<\370\000V-\262~\362\312\340\202H5\372\270"
+    "\337\217G\307&\313\264w\315\232\373\006#\243\010\265[P[\245\342\375w:\037\034\353\234:\3249\365\236<\326P\327@\320@\205T\343\231P\261k\252>k\203\3376\030\025-V[\241\242{\366\236\263"
+    "\260\330\275:\247(\014\255\010\206\213\277\355\277>\341\321\213V\245\206\341\017k\222\210\247?\202\201\316\343\306\235+\363\307\272\367o\210T\010y\005B\200\260`\325\016\334\212\036\342L\042\033\323\032\201W\022\017"
+    "\134y\367\325\240\261\235 /\134\332\366\246\214&\005,z\204A;@\333\240x\253\216\272\007\016\331\134\226\206\203\374\355\211\030n\370\015\362\267\265\316\353\361\213i_\303\013\230\276\246e\334%\362\334=j\251"
+    "\202wi\343\356JS\362\310\343\256]\333~;\264\001\010sN\036\353^\275eD\261`\330\263\364\360-v\334\305\206\331 \020\224>H\315!\003\326Z%k\252^\005\226\217\017\275T/[\277\263\366\232"
+    "\261?\300\377\2060\371\242j\325&m\020\300tR&J\346\300\323\242q'\274\302\340>X\337\233\357u/\0364\242\205X.\355\134?\323\375\372\213GKG\273\237\234\355~\271\270|w\021V\234\235\217"
+    "\037t\357\237\352\336[\350\313\202\006\007\312\330 :\351\313\012m\177\012Kr\351\301X\302w\222(\016\245v\263\011\362\277\015\012U\016\265`\315^\233\334\340\334\377\010\034\037*\300\260\134\303\020:)'\301"
+    ")\271:\017\2362\200TD\234\367/\366\356\337_\276{=\036\217\373\304\277\317\250\261`\252\212\225\307\376\271\033\261\262%3g\254\215;7\327k\023\225I\014,#VP\223F\342<q\267p\330b_"
+    "\263\217b\362.6\243\345\254\242\277p\272s\373\260\277\023/\311\376\036\351\016\241\324]\323\002M\326P\363\012\226\3032\346\340\347\316\345c42\303\255\214\257W9\226\247l:Qh\264l\007+\332\240\332"
+    "\023\255qi\300\134\001\244\023\241\361\306I\0145P\022 {:Q\243\370;w\276\355\234\377\276s\372\326\243\245\203\201\322\326\220\321\020\230\367n<p.\037rn\275\347,\134Kw\257~\210n\323\241c"
+    "\316\311\233\240\257\275\233wz\017\377\3369~\3059|\013\200w\317\275\273q'\221\347\206\002X\302\225\355\021*\250\322\032\033\030\306\004\211\2325Ke=\346b\253\016\263\302:\250\356*=c\235\274\345\207"
+    "A\365\241@\010*jR\370\006K~\377\012\011\332\370\033\373\013\032\274k\357\256\246!\247\025\370\367\042=\314`\034=y\274w\343\341\312\231\033\306\224m7\306FF\222\243\251x2W\210g\342I\303\271"
+    "q\264s\370d\367\322\015\020P\005\245F\200Z\310\253\330\200\200\2463\177{\371\336i\272\023%\234\201GK\207W>\177\027\314dg\341\253\316gW:G\276t\276\371d\345\322\277<\221JdV]\336"
+    "\015\373Y\235\005\202\311\016\311c\340\333k\253\365\024\274\033|\253q\025\024v<\023\177a{}v\223i\333Vs\337\316f\335\206\205\011\330\341\373\307\273\037\377\260r\350\004\030\344\316\373\227u\023'v\355"
+    "1.$5I\311t\344{U\336\034I5E\222\3441\021\001\327\250\263_\027H\262\031S\005\242\011\224\226\251J\315\326\220B\255/F\236\321\322\234w\346\277[9s\035\224B\220\330}\3776\310\350\362"
+    "\277.8\363\007{7\356\366\036\236\204u=\310kg\341\310\312?\216\257\234\375\362\337\360\366\3561\347\336b\357\006L\262\030\134\327\031\200\260\2203\240e\024)^F\203\042\346\356\240I0\202\203\317U/"
+    "a\276\350\263F\026\3651h.l\376!\365\314\177\317\302o\333QG\3127\2219\0204\313B'\344\332\362\375\005v\226\233m(\374\262\245\315\307s\256\252(\201~\002;G\017v\357]\207\331\214>t"
+    "?\276\320\371\3440J\342\261O:__\302]\307\023_u\216\134\005\2413\222\306\362\335\257(C\234S\327:\013\027\376=\367\216F\326\244.\247=\335\355\302\020\256n\352\312\210\355`\266\375\233\303;]"
+    "\030Y\230\3164\304\234I\201\250N\310W)\367\224\031|\377`\232\260cp\231\367\322\366\037*\362[Y\026\357k4\211\027\370|~q\371\336\355\356\021\2600_\007\311:\007\250\315\000\246\300'T\270$"
+    "\271`h\303\014L\356\361\304\340t\351\134N:\345\014\346w\006y\001\362\311+>\303\263#W\202Y\370\227f6W\017$i\247s\371\244\021\343\006)a\3634\256\302\026O\202{\321=\177\303\370\237;"
+    "\006_\251\032\042a\304?\327\252\220\311\361\042y\2465Y\012\004:Q-\360\242\210M\211\343m%\370/^\252O\217\024\262\271l*\011k_\303\006\275\303K#\337*V\315\332\236!\015l\241\042\233\272"
+    "\377<\273|\367\036\260\313\343u\317Lz\232\341\371\224!c\246b\315n\252\357\035\037J\340\315\001\031\370\377\2201Q\251V\305\322n3\252\264\327\2625L{\312\000.\355H\346\343\205d\332\310\304s\331"
+    "\364T\274\220\315\224\222\361,\010L\026 \305\363\271\321x6_0\322\361|>m\300\213|\006~&\022\231\370\350h\026\377\306\376\342\251\314(>\347\260Zn&\037O\347J\261x\042\235\303\302d,\236"
+    "\2057\004T\214W\312\247[1h\226KQ\0201\001>\367\273l\034LO)F[\002\214\030m\211@h5\002d\027\005_\000|\013@5\320\220\316\344gb\244k\322\012\333'I#lOP%\355"
+    "s\024\375\030\340\217H\001\012X5e\010\320\371\314\024<f\252\360\234\314g\360g\312L\306Si\244\033\177\042\223\001\2634\324\216\217&r\245\004<gsP\013`\346\262\005\376\042_\215'R\371\030\376"
+    "(A/\360\004L\002\350i\3224>\232\242\277\001k\200\207\254G\010P\214\245\333G\261\000F$\223\001b\362I\362/\231\006\357<\003\252\134\310\307A\244\2462\010\325\214\027\3229\374G\3212\300\213\217"
+    "\341\333j\012\030\223F\3223\003u\237\003\2700\346\243\251\3218\201Kj\247G\221\201I\362\033\010\302\212\351l6F\020\315e\363\014R\042\267\177\007\0313\003[\301\270\3473\271x\042Y\000\316\341\373T"
+    "\036\307\242P \354\215g\023\271xf\264\020\303!5\220&x*\340\220\024F3 7\331\024\320\013c\231\317\001\026\005\003\273\316\212\012ih\235\307\326\006eF>K\312\011\344\251$\320\222\006nA\347"
+    "1\004a$\351@\244\362YR)\206\265\260\373\030B`\262\230\004r\001z\214@G\341\201\376Ik\304\017\010M\021\042Fs1Q+\203$\344\021F>F\260\200W\300\022\321\303\376\035\200\035\274H\000"
+    "\327\241\177\302\333B\206\016m:M\031\222\245\314-\000:9d\367hn\006E-M\273Fn\003\213\201\354$\374\306\267t\350R\200\017\210Y:\217\242K@eZ1\004\216\343\221%e8 8\000\370"
+    "'4\211a\037\330\010\236\260Q\356\265d\012%*A\007\016\210\307\366\210\011t1\232\201\321\313\026\260q\036u\000\033\347\260\224<\354\237\006%\373\345RD\207\014\3054\011\025\241\033\372\2266!r\237c"
+    "\302JA\246\37744\242N\371`Z\365\3011n\315\351B\035-\363\230\3219\273\2702w\321\271{\370\255W\352EpHJ\255\315\257\371cef\310L1Y\261\247\332E2C\274V\251\203\361\337n"
+    "Y\253\232\042^\254\330\277k\027\177\312I\042e$6\203\232\347\211\241a\017\311T\211<'\301zf\322Y\003\264\011&\205B<\225\310\242\026\244\013\3318\030\306D6^ \003\230e\017Yh\213\312\225"
+    "E\361@\345I\245\351\023\230\343t\026\2144<\203\341\301'\200\007\003\012\205\0310\352X5\203\242\004O`\271\360M\212\026\021\020\311x\016kg\300\264\245RX7\221B\305\245\240\021\022\2103\355\022,"
+    "\002\030\274\002\032\211B&K\354:\316\012hX\012\360\026^!\001\3614\374\004\302\260\341(\222\201\320\020<yC,\004\300I \332h_\323\261l<\203V\042\015\350\221Gh\227\312\002\251\264~&\207"
+    "5\201'\244?\240\015\221\004I\307\226\361,N4d\016\200\027\311\002\265\3460O!\241I\304\042MZQ\335A\274\321\206f\020?\362\253\225\212\303\214\014|1\322\006\376]\002N\216f\371l\233&\374"
+    "\021\017`\355\221\001\250\264Hj\001:5\260S\244\010\370\301\3311\232`\234!\230\342\031IF,2\007\0066E\250\314\3433\220\211\343\017B\001\000\222\210\370(y\000,R\204\020lH\030\017\255G\331"
+    "#\322\2043\012\2145\300\207\261C\341\000\331\330\010:\235\000\277\200\374L\030L\134Q\324b\271x\016\271\234\006\333\233\242\377\337?\260\042S\225\243jL\265g\314\020\272\027\256\275\362bB\247\214\316\203\033"
+    "\313\017/9\363_//\235qN\334\021K-~<\245lM\230\355\252\275\356'Q\324\002p\0229\237,\0246\247\201\333\354\231(m&\217~\002\230\3034\350-\014N\022\335/\230+a\262M\3408"
+    "'\200\343\250yf<\013\225F\271O\001\376\004\310L\266\212&\026\032d\012\304\256\217\306q\042Ld@~P)\361\001*\342\220&s Ni\224@\370\207\277\314x:\225\303\177l<\241\0066\315f"
+    "\252(f(\225\311d\006\134\031\230\365\341\037\3576\217F=\201\323}\002\032\260\237L \300\345\001W \221.\241\177\201\020\263\2314\361\265@\354\020\031\220\261\002x()\364]aR\310\203\375\030\315#"
+    "\265\243\351\024\210Q&\203*\220']g\210,\026\012\250\327\320Y\2268N`\010\322\005\264T\3503fa\322\001\355\002\335\003\0422\205X\001x\303\236\321\365\311\027\210\016\214&K\361\134\206\312{\022\314"
+    "K65J\237\360g\301$\214&?\250\003)^\345\013\033=\357P\323R\350N%\3638Y\347\262\350\240b\203\002\005H\036\367Og\211\333\236x\334^\015\355;\342\365\026\302\273M\023\273\221\313\243\223"
+    "\236\037%#\211f\013\375\276,he\226\272n\324e\042L\317\200#\005F\022\014n\232\232l\350\035f\347\024\030\344\024\200\312dQ\370r`\226@\020\001\177ph\301\014\221g\260\0119jAR)4"
+    "\226P;\235C\357;\2353\001T\012\377qy\311\202_\227(\244@\246\262\005\364\244\241F*\237\302\177B\354`\026A\1778I\334\3708z\354I\230\247\360w*C&%\364\017\0238\035\241]N\240"
+    "\010$\363y\024\374T\236\330\3164\250F!\205\377\370:\200\326\316\242[\013\377\027*\223@$G\013\233\301\334&\320|\301\304Q v\014\210K\221\007@\021\371\014z\222\004\346\214\246\223\3008\220j4"
+    "rY\224\256D\241\360\032,oFKl\302C\210lA\2016\037\237\322\373\247Q\304\211\211\006?\011\236\320N\303$\001\250d\310\257\321B\312\004\311\317\341?\2161-Ok\212cX\216c\237\205uF"
+    "\006\235[h\317_\244\366O\203zf2(q\317\270\243\201\215\372\254U\2322mj\324\205\375\0353\302\334\262\200\350\272\024\263\240\326\230g\244\266J\315J\3036Z\315\322\370\320\0109\262\361V\273\022\377"
+    "3\311`\245\3576\370\252\321\334\210\267\252\326\344[\015\314\216\010\252N\273\2361\233\306\254U\334U/\355\261\354\315fs\033F\277^mV\215qch\2665\366\337#\377=2d<o\314Vj\345\372"
+    "l\274Z/\221\003\013\361\251z\313\256\231\323\026\274\032\032)M\227\207\326\321\134\263\252e#\270\226\002n\235xEHx\265\342\026\370\302\310\000|K\315,V\2552``7\333\226[\327\033~\203\012\021"
+    "\214\311Tj\355z\273\025\221z\221\362R\314F\013\352\2113{<\373g\314\2300\253-k-+\347\2717\236b\236\314\302\212I\351\001\332\017t\334\262\341'I{\241\301\300\227\220\037n_\2111#\302"
+    "\222\333\042\034`\022\312&h\206\240(K\271e\023f\313\026\345i(/\262\234.Q\230\201B\273\335\254\341y2Q\230e\205\344\034\221(\315a\377\230\225\246\324\315\363R\265r\001\212K\230G(JF"
+    "\241\244I\022p\367\272\350'D\241DSR\024\356w\013\221*\033sg\335\042B\020Or\342\274$\277'\3325z\027\356d\033\210u\367L\242\303\202\233M\013)\344\002d\274\300\237\342\376&l\264\370"
+    "A>\265\207J\255b\023\015%\222\371:\227|\251'\237\370\302\230\326\254Y\303\255\253\323\027q\343\213\257y\274^\303\243k\000\205#\021\265f\300\223r{\244\322T\257Z\240_\223\321\210\350\310\250\264\014"
+    "\322\264\006\252\027\021=\200\220\327\3152J\366\306Z\371\325F\031\030\277\225X\215\350p\034\324\2634\025\025\035A\037\007D\273\003a(\322;3\036\017G\322\266L\2604^\301\034\210\032*rm2\036W"
+    "\260\256L\030QfGv)\371[r/\206\241\255\022\237\002E\252Z\214\355\244\277\250\004\372\200xjY\366n\320\330z\333\216\006\014\365Z#\225H$\006\343\012?m\033\306\027[:\224\317\371\004\306\252"
+    "5\011\255\376\317\256\227_\2127\360\213=\264]\034\323\337$\274)S\270P\377\3467B\252)\271\257\363pw\024\300\015\253l2\372\330\3165k\204\206X6\331\205\001\361\010i\262N\201M\325M.s"
+    "Y|\300 RfD\337R1\032\0311*\2235\274\177\255V\257\305\220t\243a\356CY\365\215\323\001\275rbR\341\353\255\235\264Q\2245v;!\002\344\323N\340\232\177\350\232\226Y\336G\2506\306"
+    "\307\307]\335\215\277\274s\313K2\332\376\246\210D\224\014\134\013\214dm\2622\261O\240\042\015\235\242\016\273\3602\042Vi,\262\226?\272BfXU\351J\2320e\252\325m\242\364qc\263Y\303?"
+    "\020\037\016P\322\247\003\201\034\004\2351K\373v\324g\254i\262`\243\231\231\322T\345\322\217\263%{\001\042#\016\321\363\242\267\307\215hr\375z\271)\257\242\016\325_\247YoXg\214\267?0\034<"
+    "\314\273\354z\203\243\346\031\341~&Bo `\012-Y$\315\351\325J\324\303%\037\272-\222\243\202\356E\020\216$\221J\355\002\341>kL\265\254\042\3157\357+U\255\320\301d\206\207\215\004\363F|"
+    "\036\312\033R\311\233\353$j\326(-\337~\333\003\011\264H\27032\215\276\301tUD5\042\001C1M$F\356k\255QBZ\361r\2550\011\322d\037\357\001~\253C\344\363\016\206=X\005\214s"
+    "\200\230\013\322\344\017<\030\330\355Z\211j\374l\302\230\337]]CXH\275sBa\204s&\204\312\320\021\037\210B\254$\265&#\231x\242\021\354\3033\354\320\357\253\373\210\367\241\020.\346\201\246t0"
+    "\2237\200\232\341\221\332(9X\373\030\034\376y\346\245\277\022t\307\014\342bl\005\031\265\031\001\007\302\247*\326,\002\3137Z\377\251MT\004\334@\323\324\213f\205L\027\321I\366\360\237\303u\2161c"
+    "\374\266\232-\210X\013\213\244~\334w\233\343\000\010\362\237\332\030p\210A\303\000\216\232|\310[\276\351zea\256\367\305Aq\222{\371\3561q\367\265X^7\321\247\336\275\257A\026\340S\326^SZ"
+    "z\263(1\216-\274\305\217Y\215\260\033\342Y\332\333\321c\316\321\223\321\315\260\016o\014\213V\362!cl\332r\335X\272\224C0\024\000bt\344#giN\034 \026P\246\314\026&m\013\301RZ"
+    "w>\275\351\234\374\302\271\376\251\263p\015\277\274\266p\213\246vw\317\275K\370e8\007O8W\356Kk{,\305\351\250\245\256\351\377j\354\237\202\201sn\235\350\3359\005\256\236U\203\277v\2037\035"
+    "1\016H\313|V\2553\377y\357\207[\274\332\353fu\217T-%\252uO?X\371RT{\321\254V\353\015\251b\332\355\226\360\217W$l\214\360\301e\213i\212\375\213\033\267\355\336\365\326\256\335\033"
+    "7m\337\002\004\274\201_\361ys\035\005\3472\023\206\235\234\017x\264t\216\300\002qD\034}p6n\337\316\201\220+KS\004\024\262U\035\013\016g-\001\263\326@\276\2545(=\230\301x\364\310\362"
+    "\375\217\260\352\361\017\235\305\023(T\236\365?\314+\355F\243\336\264\3510b~\351\357\333f\331\037\010\010\024\231\027$\224\307\0246\350'\331\032N\343\325\312~k\263+\272\376^)3Z\0347`F0"
+    "\252\212S%\232\304+\260\306n\227\255VT\322\021eM\247\327\235\277\257\314\3159\207o\031%\344k\270Q\335W+q\331\337]\247+\337\211W\320\364y\374VW\201\211K\362\027\300:\342\265\256\241l"
+    "a\222F$\300y\357, IU\252\273\364\021\250\324\243\245\243\240[\275\233\007\215W\267\215\240\306\275sm\371\356\134\357\320\367\254\221\272`\226\042\213U\360B\232\260\332\305ORn\263\255\351h\204[2"
+    "\020\370]\304\374\252\314s-\246nE*\326\243\202k.\326\313w?pN\234\022_\255`\031p\213_t>\273\200JA\022o\301R\310\237_\243\227\134<\303\311G=\353\272N*\027!\015\030\310\361"
+    "\015\352\354)3\004\324\263\220\3503\365B\345\262\325\304\352\257\340]\012-\237\220\263[\023\266`\010\270\134/\265Q\3070\206\260\245J\234\253M\373\266\225\351\300\260\333\024\042\252\300\213\346^\211\022/@\023"
+    "jV\023?w\214\023HD\010S_\321$\342&\346\245\273\337v.|\364\234\202:\273\376}\134V\245\001\005ZHF\357\203+4\357\224\012\207s\376\342\217s\0134I[\230\271\037\347>\353^?\342"
+    "\034\277\000o\235\023\237.\337]D\204>\276\3319\012\302t\3249|\226\251\355\311\343t>uN\036\005h\335{gE\272\237D2C\032\351\225\307R\026\214\020\305^\347\025\356\307\261T\256\221\002T\266"
+    "\230\245\251ht\222H\232\352\203\330\006M.\225\344\002\254\022\0106\023\215h\204\274W\042\225X\020';\315lA\032q\277\333\201\336Ot\222h\205l\373^\000\267\210\336\247\023\001\013\036\361\203\303#N"
+    "6\230\203b\333\266\242\021r\242\024\201\272Fbr\3305Q\034\365\012\013\345\006\241N\336+\341J\242\2756\363s(\302\336\2675\211&b\247\274\025f\314j\033k\010\304\274\025\3707\014\3065\234\360\023"
+    "A\366\236\202i\300\3272\011\370w\034O\375lf\367e\217\273^\315\033\223o\002\247\345?\337`]\343\255bo\032c2\316\236\0010\033x\226j\363T\245Z\216\0222|C$\327@,\244\012\256\035"
+    "\220+\221frO\224=f\271\274\005\003\247\333+- \300jF#\245)<\363\006c\035\365H(\263?\012[]\033$U\003%\247\226^\030\376\345\007W\303\255>\265\005*\014\352\311,/}\352\034"
+    "=\215\220\346\017\323I\205\266F;\360\3361Z\042\034r\011@\220\261\367\272\001\223\012\352\336X\363\323\231>\361\177AA]\3774Jj{\370I\217\3401\2555\350\235\3632IDx\361&\376qi\370"
+    "\377\322\206u\335.\362-\242zsc\265\032\215H\337\364\211(\330AS\3274a\214\015F\236\333\025\024\015\230d1\202\024\2150\273\241\322&\031!R\031\204\312\255\251\360\367q\247Z7\206\023\034\315q"
+    "'^\377\245M\276I\030\277&\324g\372\365\334@\3452\214B\2407\004\256\006\010E\305\007\007\357<]\015\024\250\357q\011\220\230\267\3376\3260\224\310#\324\362)g\260\003\340J$\300\212\223\035\3348"
+    ";v\203\346\027\317\220J\246\327\033\265z.\244)\036\332\021M)\202\222M^\263&h\235!\232\000!\036\023K\212&\375s\024Nw\222\211\035FFx\233\353E\247M6\371^t/G{M|\230"
+    "\324'9\3567_\373\014\032\003\345\031+\321\334\353\276\311\276\027\365j\230\203D\014\2443\177\3059\361\017\027\021\012\303\307nix\307\245\341\205\031\237\134\026I\346{i0\365|\220\002\277!| \271\017"
+    "a<\360^r\342aD\203\006\363=\042\312\374L\032\3274\033Rh@I.\030\244S\371\226\223\310\260\033?vs\021\006\201\042\3351\042\003q3\027\006\001\042]\361\021\031\346j#hf\261\025\302k"
+    "\300\226\236\235\032\2277\331\015\343\345\342\237\301\214\307\367X\373ZQ\301\235a\327f\303\013\255CY\344\320D\2437\240\352\233\256.\223\261\240/\275\022\311a\314P\304\350\236\247\232\372\341\001F\341\370\244\222"
+    "\003\0001\364J G\201U\031\3261\302\315R\241\306\237=\322\344\033o_\276\366\203\312>\356f\223\0205\323[\177p\002_R\240-Y\3565\323\254\270M\322\225yi\254\371\225\014X\011w\005\343Y"
+    "%\376\206\267U\252\215\320\001\220>\200Ko\206\134^\374\000<+\276\300\220p\023B\301\307^\226\0126B\032\267\017O/\203\037#\2476x|\272\253\367V\316^\356\034\231\353,\034\021\237\232\247\263<"
+    "=Q+\317\363Z|l\202\014~\313t@\307\002\011\277s\317y\377\042[1\366\351\025/\227\015vC\334z:\337\212]\254A\256_u\346\226\374\376\042\037.i+\200\364\207S\017\2705q5\316\357"
+    "\357\006\374\324\225\271\203\254\203S\367\227\357\311\347\357\335\375\021\271\267 hJ\274\232A\274\363-\233(\016\337\242ao\202\234<q>\017\305Q \215\276V\250\202W\303\221U9[\250-\322|)I\013"
+    "r\224\334\202\241\206\254\334\0208?\017{D\033\256b\272\206qf`\266\316\373\236\364y\337\236\034\030\332\030\335\233Z\033\134\342\337\374\306pK\332\340#N\300\324YV\213#\021U\334\231\341\343\303\215\033"
+    "\020\2442\331}\220G\205\230\317\227\332\323E\230\214+\260\004\177):3\214\240g\214\015\240\331\364i\375\270\221\366:\375\352\042df\235\362R\023h\227m \035\017\357\323*ct\201\134\007_\263\037\343"
+    "}>\233v\004\010 \344m2\202\236\230Z\206\364\000\317C6&T\212\375P\023\032\250d\312\014\007\253\314\252\253\344\331\323r\374\221\030\012E\311s\242\316\361\252V\344!\204\256Y\243z\333\262\364\254r"
+    "\231\353\037\357\265a\373\0038\340c8@O\264\000v\237\303\027v\353\2645y\354Uk\323\344\350\372<n\232\320\251W\332x\243\301\317\345\273s\344\300\376a\347\344\361\356\275\353\042-\320X^:\347\274"
+    "w\014\3369\207\357\220\253q\270-\013]H\360\376\007\243'\210\026w\217\261w\363z\357\332\0343\373\357_\350\375\215\356\256I.\006.\203p\021\266\177*\242\272\030\235\323\207\344\315,\274\003\037\327\225\362"
+    "V\234\270u\337\335kS/\337\347\233d$^j\360\325\216\273\251\206@\251\013  \260;\364yK\212\210\324\204\314\241\344\306i\321\304\177-:o\315\263\021\014:\207\371\021\020\327W\273\024H\267X\273"
+    "\233\201`\202\3114\342\266\224\316\226\273;\203}\217\230s\210/cJ\351\256z\273Y\262\224\212\204QR/\362\351C\321M\360!D\016~\023k\026PK\242_\034\212\022\320}g\243\004\027|/\1348"
+    "n\036\276\313\014]:\276\330\205\2656Oa\202\216\026)~\021\036,\205\0044\345[\026\034\212\347\213\0272>\225\211\212\334\134|\220\2037u\013\334F\356=\200\242\235z\035\240\300\236\225j:\026\227\355"
+    "\011\020\336;\3678\020('\341xV\352\001\301o\234r\3319\370\225v\274\007\016\20362`\204\232-xE\256!\006\207\233\3455[6\324\331##\300n^\023]\323]z\016\025_\251\225\351\035j"
+    ".\246\344*5\261?N^\252\015H\342\235\253q\276\013\321\204\331\300z0\351\031\277\245\007\350$(\342(\034^\262\346v\255^}'p\240\225\015^[\202\303/$k\271@\036\343N2\336\321o\255"
+    "\231\012h\364l\005|\312\246U\004\023\001^\260\2216\350\255t\300\374F\025?\333n\260\374l$\015\323\3327\356\034\363\243\364\273J\315\226L\334\252\256\355\342\370\340\324b\353*\233\023\344\322\015\221&\216"
+    "\230\224\220;\315i\011\023\317]W2\207\244Q\012\322\002\337\275K\256@\2517Iq@\372\033\221$\260\332\333\234\004\324\307\273\324\211w\316}\223\342>~\1343n\340\355\331F}b\002\271\203\371\023\263"
+    "F\263]\253!\273p\215\320\304\354o\216p\334K\275\367\316\037WF}w\033\271\263\225\367f\034/P\317\2651.L\351\366\030\016\215\3275Xe\017\037\003\361s\257&:{ce\356\034GW\276\246"
+    "\350h\357\322\265\316\322\307\364\025::\344\013\024\235\017\257\2234\026\367\022#\005B\300mF\036h\242\032zN \321\237|O\337\376{\356\035\241\315\342\274\321\030p\277U)\2614\317\226\321\262\315}|"
+    "\003\004s\247\245HT\013\006\253\336\210\0334\303\321\333\020\206\025\272$9\221k\361{t\340\273+m\361}\275f\301\332\026\024\033\343zqe\332P9)\343\247\330%q\213\222\307.\215\031n\223\020\270"
+    "\034u/L\312n\037LZ\335\233\231$V\347\336\257\027\271\221,\305/T\376\032\247~\042\372\357V\2158\360\3505\372\003Q$Z\262r\351\207\225\317>\357\134<\264\362\371\247\354]p\034\224;\222\221"
+    "aO _\270\235qQG\331#\015\352]v|\231\256\235>\004\332\341\305D\211\314E#q\351SO!\270\270~\353@\310\370\277\0044\0302\322\307\177B\220q=b\0172^4\374_\225Q\320p"
+    "S\356\010\260\376\311'\333\325L\003\2221\352\266\036\226A\005\042/\352h\031\371d\313\240\300\201\220\002\245\032\016<N\020\367\015v\317\366\233o\260\313\265\337t\371\262\332\300\253\312*V8\300^\226&\376"
+    "\355\016\275\024\222\325\220\134\034\210ZZ+\214\324\342\317L%\371f\027\335\007\013\244\225\177\256\014wZ\302$\134\371p\231*\3452\010\357\361<p\352\320lJ5VC\025\013\374\014\253\000<{\233jr"
+    "\231\306\366\321kV\003\345\333]^\005\0168\312\266\364mB\225|\011\200\232;'\212\203m\225[G\253\360\007|cJ\026iF 1l\241\027F\010\377\266\243J\004k\250\036\025\042E\201\310\263\367\003"
+    "\042\376\343\334\202\374\371CX\377\3778\367\031\223M2)b\320\350\374\003xf\304\235\271\270\262\300g,B\250\0333b\333\251\342\223\214\241{\252\242\226J\260[.\323\354\226z\310\226^\014\270\217\256\007"
+    "\265N\333\025\371\346\374\270\021\325\271\027d/Zf\035\3614\230s\314\276\017\031\321\202U\223\322\334\017Q\342i@O\347\276\323i\032\367\245\367\3569\375<\355e\271\024\013\012\231\247\245ZZ\021\012\004/"
+    "\007\201B\340\313\325V\327\201\033\005\012\001\357VZ\035p74\024\002\334\2554\220C%\256\220V\306\207FV\351z\025\241\252i\340\354(\356\2608\337K\335\206\250\307*<\326qB\332\263p\246\265\363"
+    "\225J\212\262?\307\033\032\324\361\204U\250]\247[pZ\005A\375\340qQ)b:\034\260\017\347g\213\373\001\371\240AsCa!\203\346VZ\235D\210\030Y\250\207\315\352<\006h\036\367\352\007\236\327"
+    "[\2456\322\350X\230\042\322\032\253\006\313Be\241\200i\235U\203&\221\264p\310\244\212\0260\363\233\334\317N\204M?R5\217\323\344\276\320\234\270\300b5)\235\177c\000\325\300ET\211\373\251\331\262"
+    "\317C\033\371\353\003\203\177\340\042\242\233\305\345+\353ihXa\007\211\215\355f\363X 7<\0214\225#.\210a\011\134\340\030y`\205\014U\265\270\335\233$\256U\024_,M\305\217\201\031\346\360\302"
+    "\265\311\007,\024A\214n\206\341\247\015\365y\321C \303\014X rZH!\270\321\260\313`\014\364\006\321T\004%H\3032\330p>za\366Eu\020V\016\202(\345\246\373\034\312\321U`\311\357\244"
+    "\036\214\245\236\020\247\212\250\002jX\205\034\316U\017X-\272|\242\324\334\236\216\220\242}\346\327\300f\336$1\233\234\027\010\343\204\366\006wOr$\003\343\315\310c\305\036n\014p\026\134X\344\027\224)"
+    "^\027\203T\270'\332\215\205\264s\003\234\032\316{\031j6\032\325}|W\001\246\245\006\260\315\212\222k[\2243tX\202\3513\370;N\274:\374\013O\213\324'\244\302\260\033Whf\217\310\370QR"
+    "|\372\335\3552X\017\352\312\336\347\204\302\234\353k\022\015\001\347\363'}\214\240\254\367r\202\226\262\020\216$\001\344H\202B\266\346\212\257P\010\262\014\241g\252\026\214i\356\007\363\245\313T\213\273\373&\314"
+    "\004|\354\302;%\354f93\374II$\037`\230d\303\332\037)\375\327\010t\306\225\343%\377%\3416\200~>\241\225\302]\013\345\2233\364.\377(\273^i-\221\026\235\251j\3679\206\350\3770"
+    "\200\306P\2655\207\021y\271\327TQ \276Z\312\0016\365\013\005\254\022\211J \031\276\266\276#\0074\335WI\266\022\011\361\255v\251\004p=\227cx\016\245\3745\0048\315 6\016\2545R\331D"
+    "\300YP\023\017\024\272\243\023x\233\230\300A\227\214\327\004\333\010\035\232\263\230\2372a\341\265c\221\021\263Q\031)\001\250\310Z@\262d\202\214\221\244\346X\313\2567q;\310s-\202M\264[@A\220"
+    "\361?\2670\271\327[\217\035\303S\214\015I\207R\377\242\307\365^\360\225\214)\027\025\340\377\344K\014\344a3Bn\017$2\355&\371\257Y\343\231\005\244\017jj\312\342\242\251\224\247/\247\373\257\026\036"
+    "o\251\200s\023\377W\013\216\267\034\026\320\016\004\314\0372?\370\134B\346M\344W\324w\305\331\263\272\247L:\204\246*\221\357\320\220\341^C\361h\351\034\335\253\247\033R\313w\027\351\311\372hz\030w"
+    "\203?\270\042\247\005\257|\366\367\316w\237\270\347y\017\337\242m%\300\274g\230\353\344\234Y2\265\327H\336-\311\003URp\225c\276\360Rn\270\336Hx\2136\364K\317M\007d\336z\357\021\221\016"
+    "\361\000\033<\347x\214W\267=\027\324AB\313\364\201\222\011\215\360C;\252\204=\366\355\200\201\322\347rc\320,\315\260\034MLj|x\336\231\277\302\366\227\317\334\006>\012\231\241\251J\275\207\207\330\301"
+    "(r\241\010;\017N\016\200\363|\315\243+\007\037:\363\307\360z\004\221\234\307\362C\356\036\243W%\374{\356\035\271W\221F\262\362\361A\350\003:\356\335\371\016z\352\035\302|\006\012]\300u\016\177\346"
+    "\134\375\3009zz\345\323\333\235\033?\364\256~\201\271\375\207\2169\227\2179K\377\352~uF\006\256\321\034\264\016\276\024o([\243\273\250P\253\264\333M\022I\364\334X8\3101vy\304\372*\2656"
+    "\274\215\366:8#\022\317\275\357\250\324*\314\032\014\222\033)\232\340C\263\335\000\253\3053%\327\205\351\332c`G\3220\251\202\016\234\265\211?\032u-N\342\351\031o\036\350S\247\007\322{\357\275D\042"
+    "\335QJ\030\026\216\012\346\014\252\237R\355\037LV>\362\0144\366\361\306\320\027r?\237\252\367f\021\015\266\025$_\033\353\275!\271iM \374\221\206\262k\344\005\246\371>\354S J9\301\326\027\014"
+    "~\304\261?kB\016\022\212\317\273>\001.\252\023\037\012\306\025\0279NJ%\306\375\256'\371\242g\367\235\177\361\235Le\374<\037\300\354\317r\377G@\007\023&OG!B\360\214PR\330\377\364V"
+    "V\356\302\252\337Z\244\317\312#\210l\234\365\226>u\346\017\367n\336sN\234\306#\016\377\274\311\262\013\216\343F6\316\254\227\277\351}\177E\366\317\014\134}<\316\252\205\353\302S\134\271\370\242#\224S"
+    "\301\013=#,\372\344\267\353\203\236\016\012\003-m\306\343\204\216\011~!\276\367X\250/\177\300]\207\320\220\002B+JI\236\276@\203\240d8LJ`h|1t)`e\261\340\3243\010\037\270B"
+    ".\255\306\007\210\011H\353\314\201\264\243\317\271\267\201\204V\222\242i\313\236\252\343\365\216;_\336\265;\042\257\016\351\367\206Inh\204\315\3641\134\004G\2402\012H\205N^#(\312\021y@a\235Z"
+    "/\303\032\325{\023\342\200b\263f\215\305\205\004\006\333\225\344_\220V\261 ^H\364\323\263\006\2438\006\006O\364k2#0\026\026\234\216\342\334\371\226\235\2020\330\021\2102\014\270Kk\250\027jO\341"
+    "\355\033\230\350\277\245\331\2547\243\236x-\225\327a\0362\3411-\350\347\325\332\236Z}\266fX\330,\022f~\224S\202\253#OB\364\005#\312\016{P\253\316r\020\310\312\303\022\210\275 =\343\275"
+    "\211\344\320\311\312\307g{7oF\206epc\000\016YeL\230\225*\277\353\264\017\264\227\350q\024N\36200\331C}X\030\015\224\321\033\030\215Nk.h\376_\303\364\223\030\246\240)\010\247\235_"
+    "\256\015\372_\353\360\377\213uP\234\134wI\351~\212FR\027\263\021#\007\240&_`\227\204\362\354\240qz\016]`\036\007\336\325\242M&>\270\027\300\237\231\214z\253RY\366_\2236\240\324J\225"
+    "\331*\317\373\236&\306\221;\202\235\007\363\364\004\330\362\303K\235\2037=\325\036{\025\352\271\215\245\017\264>\213Qu\201\326\027\032h\2066W\214p\244\006E\370\026\343\265\224\237\255J\331\013Z\360\017k"
+    "\363a\36531\034\207\300\2442v2\223\312\257\257\033/.a\211\222\225\211\312\357_\321&JF^\337\266u\333\330\356\261\327wn\134\267kL\351\210P\377\274\021Y\267sL\213\000y\267\316\307n\215"
+    "!z\042\036H\347O\361\222\3413\027)W`\341\357\353\372\311XP\2537\000\213@.h(]\245\330\272\361\217\300\223H\342\314\2506\024\347\353\310\223\220\376+I?\214\306\033D?\336\354\337\035\246\344"
+    "\204\364\0270\240\256e\220\216\306\016\312\021\263\3014\217_\241)T\014\365-2\270\016\233\015It\024`\015.\246\253\003(e\364\351\015\003A\362yn7y'/\220\373m\356|\313\242UDD\207\311"
+    "\244\015\305\312\021\352a\017w\265+\011\311\205a_}\042\263\221\327\330\363\134_\3622\032\241\011\210,\304JgR\0140\343K\237\037\302\346f]\033boH\253\270\330\303\367\316\206!\337\265\200\231W3"
+    "#2\367\030\231\027\342\032\253r\021\007\217o\332u\315\370\325o\214\345\241`\274R\241\134C\270\006\321\360z.\234!x\020\373\301G\316\374\225\215;\351\351\372\210\216\372\200[\010\211\373\016\300\343U\2536"
+    "iO\341\356^2\250#\016\177\371\356\261\336\337\356\367n\317\367\036\036J'\361\020+9\204\277\332n\005_p\377\206=\273h$t\305\353\215B\020rT\202{\207\276sn\235\242\033\211\205\307\302L\134"
+    "[\010\322\240l\266#\227\306\310O\327\335o\210\253\011\370\023\007'\206O\353X)\013\221\240e\210\273\010\2214\241\377r\304\225w\351\022?\335\242\204\242\042.\330\3739\335\272\201\234\266\247\351\262=M\207"
+    "\355\311\3345\025\326\200\376\331O\340\235\375\022|\263\200\211\374\331\373e?\241Wv`Ur\371\224<\262\237\322\037\323\016\242l\2715\013ie}\217\356Pg\341\253\356\205+|\355\2543\347O\356\214P"
+    "<V\347\214h\332<\2313B>f\245\361F\370m\270\230\347\035x\022\012L\247s\343\034\346\320\370\356\221qN\236y\264tA\334\347Boq\301\233$\014\371r\031v\335\307\013\206\377\366\226xD\311"
+    "\237\010\230=\311\267,\026i\342\007\355\214\366\344\334\134\352\035\372\036<\225\3167\357t\216\276\323\373\341\016\356\227}\376wt\346n\317w\316\334\346\337\3769\317\376<|Z\016\2278\237\035\352]}\017/"
+    "\367\271\363-\275\304\234\202\355\034=\344\336\014)fnL\376\251\222\033\207\311\2152\305z\223\247\004U\345P8K\345\243\271\214\333\320=\363\2456\272\300\342&\202\211\202\350\245i\042\243D\360\375\207\335\217"
+    "\257\031/n\331mtN\234\134^\274\014\254_\276\177\214\022\213d\222\275B\314\212\001\272\310W\031\260\356\010\316\366a>\302\010\021\005\262\001\330\252L\326\314\352\230\214\016-\372ygmI\021\202$\022\306"
+    "\313/\213\230\331\246\012\242V\012\327\302\203W\012\003b\211\004\033_^\252\307\250kr\033<\246\330\363-VR\326\317z\001\001\036\335\377\211\254\027\346\033\334z\217j\011\355~\204\352\016\325\024\312\341\316\365"
+    "\1778\013\327\304\235M\335{g\235C\213Xx\362\024\310*\371\222\026K\323\372qna+\211>\342\010\020\201\374q\3563T\275\233Kz\333\367\263\017y\237\001\3573\334\376\301\226\371>Q\001\355\252\356"
+    "\323\000.U-\263\311\373\025\306c\220e\246\313\272'N4o\351\367b~9i\344!c3\350N\317Z#\353\216\217\233cC\257s\026\247\236\235\313\247W\376v\215^pE\252\260\304'\374\204t\245"
+    "\264\307\010\376T\262{i\002IV\011e\267\232\325\042o}\321\357(\333f\023\332\0205\020\000\225\223\235\301\262x@A\307=\330\330\177?n\025H\271`}Xi3\202<\233\007\202\247\270y\200{Q"
+    "\312V\243\344\245\360\214\314q\203~\012f'\375[\312\353\230\256\267k\240/\240\373\244\356&\263<i\355\3002i\341\013X\243U\031c7\270J\206\306\255c\302$ho\255\215\321\007\267\274^#\371\237"
+    "\233\311%\260c,K\234\024\3714y\240Dp\322t\320\004p\325\000\030\317\342x=\336$\035\225\251 \014\015\271W\277\245\264\247\254VS\364\345o\312\312/<\237\274T^Y\364S\346\030\204\340\303$"
+    "\2160x*nv\207/tD\321\247\204\345H\313\336\262\267Tm\267*3\026s\332x\253\220\217&\373\214o0\003Wq?A\300\027\333\245q\364]\202/\277Q.\374\346/\304\265\2624\336A\357."
+    "\200\331\221^y\322\273\3657p%\325\373\310X\303\340\033\035\320\021\3409\326\364:\225\316\305\023\364\042\025\203\134\360\241F#\237\361\315),\255X\275\265d\235\256j\310\025%jk\337\300\014\230\353\342V"
+    "\0130r\342\344!\230J{'8\326\370M\242d\042\341q\360\273\367N\301\262\012\034$\317e\215x\211\315\322\034\314=\012\203\237\301\011>\227\323\217{\226Oj\271\252\033\263\373$\273A\337\036\204\002\256"
+    "\220\226\031\364\354N\024\312\323\314\223\236-\364\300X-\3274\2717\032\214\372\234\021\015e\246+\237\235\177\314u.\134\241\237\224\355,\034\0211\324\356\271w\225M.}(\372\247\134AJ'\275\264\333\367"
+    "x\242\205\234!\241\004\360\373_\015\276\2108\014\326\261s\370\016~\276a\341\032\336\210\265q'~;\223\336\004KO\301\2707E\205\020=\302/x\305\325\265\032\177\227\227\0012\255\042 \340\336U\263q"
+    "'\213\255\334\371\226\3355;\274\372%\235'\010E\307\222\302\245\207p\274\241(\356\021\343\257\365#\255R\263\322\2607<\267~\004c\374\370{\312\236\256n\370\177\3361y\023\310\353\000\000"
+;
+
+#endif  // WEB_CONTROLLER_PAGE_H_
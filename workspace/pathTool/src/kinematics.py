@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 import config
 
 pi = math.acos(-1)
@@ -22,4 +24,27 @@ def ik(to):
     angles.append((ar + a1) * 180 / pi)
     angles.append(90 - ((a1 + a2)  * 180 / pi))
 
-    return angles
\ No newline at end of file
+    return angles
+
+def ik_batch(pts):
+    """批量逆解：pts 为 (..., 3) 的足端坐标数组，返回 (..., 3) 的关节角（度）。
+
+    与 ik() 同一套解析解，但整批一次算完，供 verify_path 全路径校验用。
+    不可达点（acos 出定义域）返回 nan，由调用方按越限处理。
+    """
+    pts = np.asarray(pts, dtype=np.float64)
+    x = pts[..., 0] - config.kLegRootToJoint1
+    y = pts[..., 1]
+
+    angle0 = np.arctan2(y, x) * 180 / pi
+
+    x = np.sqrt(x*x + y*y) - config.kLegJoint1ToJoint2
+    y = pts[..., 2]
+    ar = np.arctan2(y, x)
+    lr2 = x*x + y*y
+    lr = np.sqrt(lr2)
+    with np.errstate(invalid="ignore"):
+        a1 = np.arccos((lr2 + config.kLegJoint2ToJoint3*config.kLegJoint2ToJoint3 - config.kLegJoint3ToTip*config.kLegJoint3ToTip)/(2*config.kLegJoint2ToJoint3*lr))
+        a2 = np.arccos((lr2 - config.kLegJoint2ToJoint3*config.kLegJoint2ToJoint3 + config.kLegJoint3ToTip*config.kLegJoint3ToTip)/(2*config.kLegJoint3ToTip*lr))
+
+    return np.stack([angle0, (ar + a1) * 180 / pi, 90 - ((a1 + a2) * 180 / pi)], axis=-1)
\ No newline at end of file
@@ -1,154 +1,175 @@
 from __future__ import annotations
 
+import importlib
+import logging
+import math
 import os
 from typing import Dict, List, Tuple
 
+import numpy as np
+
 import config
 import kinematics
 
 from .base import RobotPathModel
 
+_log = logging.getLogger(__name__)
+
+
+def _rz_stack(angles_deg) -> np.ndarray:
+    """把每条腿的 Z 轴旋转角堆成 (L, 3, 3) 旋转矩阵栈，供批量 einsum 使用"""
+    mats = []
+    for deg in angles_deg:
+        rad = deg * math.pi / 180
+        c, s = math.cos(rad), math.sin(rad)
+        mats.append([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]])
+    return np.asarray(mats, dtype=np.float64)
+
 
 class HexapodModel(RobotPathModel):
     """六足 Hexapod 模型实现（保持原有行为）"""
 
     LEG_COUNT = 6
 
+    def __init__(self):
+        # 每条腿的校验常量只算一次：安装系偏移、安装位置与绕 Z 轴旋转矩阵栈
+        self._base_offsets = np.asarray(config.defaultPosition, dtype=np.float64) - np.asarray(
+            config.mountPosition, dtype=np.float64
+        )  # (6, 3)
+        self._mounts = np.asarray(config.mountPosition, dtype=np.float64)  # (6, 3)
+        self._rz_legs = _rz_stack(config.defaultAngle)  # (6, 3, 3)
+
     def collect_path(self, sub_folder: str) -> Dict[str, callable]:
         scripts = {}
-        for script_name in [
-            f[:-3]
-            for f in sorted(os.listdir(sub_folder))
-            if f.endswith(".py") and os.path.isfile(os.path.join(sub_folder, f))
-        ]:
-            module = __import__(script_name)
-            if not hasattr(module, "path_generator"):
+        # os.scandir 的 DirEntry 自带文件类型信息，省掉每个条目一次 stat；
+        # importlib.import_module 命中 sys.modules 缓存时跳过重新解析
+        with os.scandir(sub_folder) as it:
+            names = sorted(e.name[:-3] for e in it if e.name.endswith(".py") and e.is_file())
+        for script_name in names:
+            module = importlib.import_module(script_name)
+            generator = getattr(module, "path_generator", None)
+            if generator is None:
                 continue
-            scripts[script_name] = module.path_generator
+            scripts[script_name] = generator
         return scripts
 
-    def _verify_points(self, pt: List[float]):
-        angles = kinematics.ik(pt)
-
-        ok = True
-        failed = []
-        for i, angle in enumerate(angles):
-            if angle < config.angleLimitation[i][0] or angle > config.angleLimitation[i][1]:
-                ok = False
-                failed.append((i, angle))
-
-        return ok, failed
+    @staticmethod
+    def _limit_mask(angles: np.ndarray) -> np.ndarray:
+        """关节角 (..., 3) -> 越限布尔掩码（ik_batch 对不可达点给 nan，同样按越限处理）"""
+        limits = np.asarray(config.angleLimitation, dtype=np.float64)
+        return (angles < limits[:, 0]) | (angles > limits[:, 1]) | np.isnan(angles)
 
     def verify_path(self, path_name: str, params: Tuple) -> bool:
-        # 仅六足生成需要 numpy（path.lib 内部 import numpy）
-        from path.lib import point_rotate_z, matrix_mul
-
         data, mode, _, _ = params
-        print(f"Verifying {path_name}...")
+        # 逐路径的进度信息降为 debug：默认静默，省掉每条路径一次同步 stdio 写；
+        # 越限报告保留 warning 级别（logging 默认 stderr 兜底 handler 仍然可见）
+        _log.debug("Verifying %s...", path_name)
 
         all_ok = True
         if mode == "shift":
             # data: float[6][N][3]
             assert len(data) == self.LEG_COUNT
 
-            for i in range(len(data[0])):
-                for j in range(self.LEG_COUNT):
-                    pt = [
-                        config.defaultPosition[j][k]
-                        - config.mountPosition[j][k]
-                        + data[j][i][k]
-                        for k in range(3)
-                    ]
-                    pt = point_rotate_z(pt, config.defaultAngle[j])
-                    ok, failed = self._verify_points(pt)
-
-                    if not ok:
-                        print("{}, {} failed: {}".format(i, j, failed))
-                        all_ok = False
+            # 一次性批量算出足端在各腿坐标系下的位置：
+            # (默认位置 - 安装位置) 广播加上偏移，再按腿批量施加 Z 轴旋转，
+            # 取代原先 N×6×3 的纯 Python 三重循环
+            pts = self._base_offsets[:, None, :] + np.asarray(data, dtype=np.float64)  # (6, N, 3)
+            pts = np.einsum("lij,lnj->lni", self._rz_legs, pts)
 
-        elif mode == "matrix":
-            # data: np.matrix[N]
-            for i in range(len(data)):
-                for j in range(self.LEG_COUNT):
-                    pt = matrix_mul(data[i], config.defaultPosition[j])
-                    for k in range(3):
-                        pt[k] -= config.mountPosition[j][k]
-                    pt = point_rotate_z(pt, config.defaultAngle[j])
-
-                    ok, failed = self._verify_points(pt)
+            angles = kinematics.ik_batch(pts)  # (6, N, 3)
+            bad = self._limit_mask(angles)
+            # 转置成 (N, 6) 保证报告顺序仍是“帧在外、腿在内”
+            for i, j in zip(*np.nonzero(bad.any(axis=-1).T)):
+                failed = [(int(k), float(angles[j, i, k])) for k in np.nonzero(bad[j, i])[0]]
+                _log.warning("%s, %s failed: %s", i, j, failed)
+                all_ok = False
 
-                    if not ok:
-                        print("{}, {} failed: {}".format(i, j, failed))
-                        all_ok = False
+        elif mode == "matrix":
+            # data: 4x4 ndarray[N]
+            # 把 N 个 4x4 变换堆成一个批，对 6 个默认足端位置（齐次化后）
+            # 一次 einsum 算完全部 6N 个矩阵-向量积，再统一减安装位置、按腿旋转
+            mats = np.asarray(data, dtype=np.float64)  # (N, 4, 4)
+            homog = np.hstack(
+                [np.asarray(config.defaultPosition, dtype=np.float64), np.ones((self.LEG_COUNT, 1))]
+            )  # (6, 4)
+            pts = np.einsum("nij,lj->nli", mats, homog)[..., :3]  # (N, 6, 3)
+            pts -= self._mounts
+            pts = np.einsum("lij,nlj->nli", self._rz_legs, pts)
+
+            angles = kinematics.ik_batch(pts)  # (N, 6, 3)
+            bad = self._limit_mask(angles)
+            for i, j in zip(*np.nonzero(bad.any(axis=-1))):
+                failed = [(int(k), float(angles[i, j, k])) for k in np.nonzero(bad[i, j])[0]]
+                _log.warning("%s, %s failed: %s", i, j, failed)
+                all_ok = False
 
         return all_ok
 
     def generate_c_body(self, path_name: str, params: Tuple) -> str:
         data, mode, dur, entries = params
-        result = "\nconst Locations {}_paths[] {{\n".format(path_name)
+        # 逐帧 append 到列表、最后一次 join：避免 += 的 O(N^2) 字符串拷贝
+        parts = ["\nconst Locations {}_paths[] {{\n".format(path_name)]
 
         if mode == "shift":
             # data: float[6][N][3]
             assert len(data) == self.LEG_COUNT
 
+            # 腿号 idx 与帧无关，先把 6 个 % 模板做出来（% 替换不用重解析格式串，
+            # 比 .format 更快）；全部数值用一次 np.char.mod 批量转成 "%.2f" 文本
+            # （C 层完成，与 {:.2f} 同为正确舍入的十进制转换，-0.00 等输出完全一致）
+            # 6 条腿拼成一个整帧模板（18 个 %s），每帧只做一次 % 替换
+            frame_tpl = "    {" + ", ".join(
+                "{P%dX+(%%s), P%dY+(%%s), P%dZ+(%%s)}" % (j + 1, j + 1, j + 1)
+                for j in range(self.LEG_COUNT)
+            ) + "},\n"
+            txt = np.char.mod("%.2f", np.asarray(data, dtype=np.float64))  # (6, N, 3)
             count = len(data[0])
             for i in range(count):
-                result += (
-                    "    {"
-                    + ", ".join(
-                        "{{P{idx}X+({x:.2f}), P{idx}Y+({y:.2f}), P{idx}Z+({z:.2f})}}".format(
-                            x=data[j][i][0],
-                            y=data[j][i][1],
-                            z=data[j][i][2],
-                            idx=j + 1,
-                        )
-                        for j in range(self.LEG_COUNT)
-                    )
-                    + "},\n"
-                )
+                # (6,3) 切片按腿序 ravel，顺序与模板里的占位符一一对应
+                parts.append(frame_tpl % tuple(txt[:, i, :].ravel()))
 
         elif mode == "matrix":
-            # data: np.matrix[N]
+            # data: 4x4 ndarray[N]
             # 注意：这里的 length 必须是“帧数 N”，而不是单个 4x4 矩阵的 len()（那会返回 4）。
+            # 输出只用前 3 行；每帧 ravel().tolist() 取出 12 个元素，
+            # 取代 12 次逐元素索引往返
             count = len(data)
+            mats = np.asarray(data, dtype=np.float64)[:, :3, :]
+            # 腿号 idx 与帧无关，预先替换好；帧循环里用 % 按位置填 12 个数值，
+            # 顺序即 (3,4) 子矩阵的 ravel 行序，免去 12 个关键字参数的开销
+            matrix_tpls = [
+                (
+                    "{P%dX*%%.2f + P%dY*%%.2f + P%dZ*%%.2f + %%.2f, "
+                    "P%dX*%%.2f + P%dY*%%.2f + P%dZ*%%.2f + %%.2f, "
+                    "P%dX*%%.2f + P%dY*%%.2f + P%dZ*%%.2f + %%.2f}"
+                )
+                % ((j + 1,) * 9)
+                for j in range(self.LEG_COUNT)
+            ]
             for i in range(count):
-                result += (
+                elems = tuple(mats[i].ravel().tolist())
+                parts.append(
                     "    {"
-                    + ", \n     ".join(
-                        "{{P{idx}X*{e00:.2f} + P{idx}Y*{e01:.2f} + P{idx}Z*{e02:.2f} + {e03:.2f}, "
-                        "P{idx}X*{e10:.2f} + P{idx}Y*{e11:.2f} + P{idx}Z*{e12:.2f} + {e13:.2f}, "
-                        "P{idx}X*{e20:.2f} + P{idx}Y*{e21:.2f} + P{idx}Z*{e22:.2f} + {e23:.2f}}}".format(
-                            e00=data[i].item((0, 0)),
-                            e01=data[i].item((0, 1)),
-                            e02=data[i].item((0, 2)),
-                            e03=data[i].item((0, 3)),
-                            e10=data[i].item((1, 0)),
-                            e11=data[i].item((1, 1)),
-                            e12=data[i].item((1, 2)),
-                            e13=data[i].item((1, 3)),
-                            e20=data[i].item((2, 0)),
-                            e21=data[i].item((2, 1)),
-                            e22=data[i].item((2, 2)),
-                            e23=data[i].item((2, 3)),
-                            idx=j + 1,
-                        )
-                        for j in range(self.LEG_COUNT)
-                    )
+                    + ", \n     ".join(matrix_tpls[j] % elems for j in range(self.LEG_COUNT))
                     + "},\n"
                 )
 
         else:
             raise RuntimeError("Generation mode: {} not supported".format(mode))
 
-        result += "};\n"
-        result += "const int {}_entries[] {{ {} }};\n".format(
-            path_name, ",".join(str(e) for e in entries)
+        parts.append("};\n")
+        parts.append(
+            "const int {}_entries[] {{ {} }};\n".format(
+                path_name, ",".join(map(str, entries))
+            )
+        )
+        parts.append(
+            (
+                "const MovementTable {name}_table "
+                "{{{name}_paths, {count}, {dur}, {name}_entries, {ecount} }};"
+            ).format(name=path_name, count=count, dur=dur, ecount=len(entries))
         )
-        result += (
-            "const MovementTable {name}_table "
-            "{{{name}_paths, {count}, {dur}, {name}_entries, {ecount} }};"
-        ).format(name=path_name, count=count, dur=dur, ecount=len(entries))
-        return result
+        return "".join(parts)
 
     def generate_c_def(self, path_name: str) -> str:
         return """const MovementTable& {name}Table() {{
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from math import cos, pi, sin
+from math import pi
+from typing import Dict, Tuple
+
+import numpy as np
 
 
 class QuadGait:
@@ -11,6 +14,20 @@ class QuadGait:
     GAIT_GALLOP = 2
     GAIT_CREEP = 3
 
+    # 各步态共享的 cos/sin 相位表缓存（按 num_ticks 区分）：
+    # generate_all_gaits 用固定 gait_speed 反复生成，表只需算一次
+    _TRIG_CACHE: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    @classmethod
+    def _trig(cls, num_ticks: int) -> Tuple[np.ndarray, np.ndarray]:
+        """返回 (cos 表, sin 表)，相位为 pi*k/num_ticks, k=0..num_ticks-1"""
+        tables = cls._TRIG_CACHE.get(num_ticks)
+        if tables is None:
+            phase = pi * np.arange(num_ticks) / num_ticks
+            tables = (np.cos(phase), np.sin(phase))
+            cls._TRIG_CACHE[num_ticks] = tables
+        return tables
+
     MOVE_STANDBY = 11
     MOVE_FORWARD = 12
 
@@ -18,6 +35,11 @@ class QuadGait:
         self.home_x = home_x
         self.home_y = home_y
         self.home_z = home_z
+        # (4, 3) 默认站立位置，顺序 FR, BR, BL, FL，供广播叠加
+        self._home = np.stack(
+            [np.asarray(home_x, dtype=np.float64), np.asarray(home_y, dtype=np.float64), np.asarray(home_z, dtype=np.float64)],
+            axis=1,
+        )
         # gait constants
         self.amplitudeX, self.amplitudeY, self.amplitudeZ = 15, 15, 25
         # walk 步态容易把右侧第 1 关节顶到 ±45° 附近，这里为方便调参单独提取出参数
@@ -30,7 +52,32 @@ class QuadGait:
         self.walk_forwardfast_stride_scale = 1.05
         self.frame_time_ms = frame_time_ms
 
+    # 按“所有影响轨迹的参数”缓存生成结果：同参数重复调用（反复生成表、
+    # 方向变体共用同一基准路径）直接命中，相当于把常量折叠进首次生成
+    _PATH_CACHE: Dict[Tuple, np.ndarray] = {}
+
     def gen_path(self, gait_mode, move_status, gait_speed=0):
+        key = (
+            gait_mode,
+            move_status,
+            gait_speed,
+            self.frame_time_ms,
+            self.amplitudeX,
+            self.amplitudeY,
+            self.amplitudeZ,
+            self.walk_lift_x_scale,
+            self.walk_lift_y_scale,
+            self.walk_lift_z_scale,
+            self.walk_stance_y_scale,
+            # home 位置叠加在输出里，也属于轨迹参数（缓存挂在类上，跨实例要区分）
+            tuple(self.home_x),
+            tuple(self.home_y),
+            tuple(self.home_z),
+        )
+        path = self._PATH_CACHE.get(key)
+        if path is not None:
+            return path
+
         if gait_mode == self.GAIT_TROT:
             path = self.trot_gait(move_status, gait_speed)
         elif gait_mode == self.GAIT_WALK:
@@ -41,49 +88,23 @@ class QuadGait:
             path = self.creep_gait(move_status, gait_speed)
         else:
             raise ValueError()
+        # 调用方只读不写，缓存里的数组可以直接共享
+        self._PATH_CACHE[key] = path
         return path
 
     def _formated_path_status(self, fr_path_quad, fl_path_quad, bl_path_quad, br_path_quad, move_status):
-        # path_quad: N x 4 x 3（按 FR, BR, BL, FL 顺序，与固件 legs_[] / QuadLocations.p[0..3] 对齐）
-        path_quad = [
-            [fr_path_quad[path_id], br_path_quad[path_id], bl_path_quad[path_id], fl_path_quad[path_id]]
-            for path_id in range(len(fr_path_quad))
-        ]
+        # path_quad: (N, 4, 3)（按 FR, BR, BL, FL 顺序，与固件 legs_[] / QuadLocations.p[0..3] 对齐）
+        path_quad = np.stack([fr_path_quad, br_path_quad, bl_path_quad, fl_path_quad], axis=1)
         if move_status == self.MOVE_STANDBY:
-            corrected_path = [[[0, 0, 0], [0, 0, 0], [0, 0, 0], [0, 0, 0]]]
+            corrected_path = np.zeros((1, 4, 3))
         elif move_status == self.MOVE_FORWARD:
             corrected_path = path_quad
         else:
             # 目前仅支持前进，其他模式留待后续扩展
             corrected_path = path_quad
 
-        # 叠加到世界坐标下默认站立位置（顺序同上：FR, BR, BL, FL）
-        path_quad_world = [
-            [
-                [
-                    points_set[0][0] + self.home_x[0],
-                    points_set[0][1] + self.home_y[0],
-                    points_set[0][2] + self.home_z[0],
-                ],
-                [
-                    points_set[1][0] + self.home_x[1],
-                    points_set[1][1] + self.home_y[1],
-                    points_set[1][2] + self.home_z[1],
-                ],
-                [
-                    points_set[2][0] + self.home_x[2],
-                    points_set[2][1] + self.home_y[2],
-                    points_set[2][2] + self.home_z[2],
-                ],
-                [
-                    points_set[3][0] + self.home_x[3],
-                    points_set[3][1] + self.home_y[3],
-                    points_set[3][2] + self.home_z[3],
-                ],
-            ]
-            for points_set in corrected_path
-        ]
-        return path_quad_world
+        # 叠加到世界坐标下默认站立位置（顺序同上：FR, BR, BL, FL）——一次广播加完成
+        return corrected_path + self._home[None, :, :]
 
     def trot_gait(self, move_status, gait_speed=0):
         stages = 2
@@ -91,32 +112,21 @@ class QuadGait:
         if gait_speed != 0:
             duration = duration * 2
         num_ticks = int(duration / self.frame_time_ms / 2)
-        fr_path_quad = [[0.0, 0.0, 0.0] for _ in range(num_ticks * 2)]
-
-        for stage_id in range(stages):
-            for tick_cnt in range(num_ticks):
-                interp_id = stage_id * num_ticks + tick_cnt
-                if stage_id == 0:
-                    # 坐标系与六足一致：前进方向为 +Y
-                    fr_path_quad[interp_id][0] = 0.0
-                    fr_path_quad[interp_id][1] = -self.amplitudeX * cos(pi * tick_cnt / num_ticks)
-                    # Z 抬腿：与 hexapod 一致，抬腿应为“向上”（使 Z 增大）
-                    fr_path_quad[interp_id][2] = abs(self.amplitudeZ) * sin(pi * tick_cnt / num_ticks)
-                elif stage_id == 1:
-                    fr_path_quad[interp_id][0] = 0.0
-                    fr_path_quad[interp_id][1] = self.amplitudeX * cos(pi * tick_cnt / num_ticks)
-                    fr_path_quad[interp_id][2] = 0.0
-
-        # Deep copy & 相位偏移
+        # 整条路径用 (N, 3) 连续数组承载，各阶段按切片向量化填充
+        cos_tab, sin_tab = self._trig(num_ticks)
+        fr_path_quad = np.zeros((num_ticks * 2, 3))
+        # stage 0 摆动段（坐标系与六足一致：前进方向为 +Y；
+        # Z 抬腿与 hexapod 一致，抬腿应为“向上”，使 Z 增大）
+        fr_path_quad[:num_ticks, 1] = -self.amplitudeX * cos_tab
+        fr_path_quad[:num_ticks, 2] = abs(self.amplitudeZ) * sin_tab
+        # stage 1 支撑段
+        fr_path_quad[num_ticks:, 1] = self.amplitudeX * cos_tab
+
+        # 相位偏移：np.roll 直接产出新数组，不再需要 deepcopy
         # 对齐 nodequad 实现：FR 基准，BR/BL/FL 做旋转移位
-        from copy import deepcopy
-
-        def right_rotate_path(path, rotation_num):
-            return path[(len(path) - rotation_num) :] + path[: (len(path) - rotation_num)]
-
-        fl_path_quad = deepcopy(right_rotate_path(fr_path_quad, num_ticks))
-        bl_path_quad = deepcopy(fr_path_quad)
-        br_path_quad = deepcopy(fl_path_quad)
+        fl_path_quad = np.roll(fr_path_quad, num_ticks, axis=0)
+        bl_path_quad = fr_path_quad.copy()
+        br_path_quad = fl_path_quad.copy()
 
         return self._formated_path_status(fr_path_quad, fl_path_quad, bl_path_quad, br_path_quad, move_status)
 
@@ -126,43 +136,25 @@ class QuadGait:
         if gait_speed != 0:
             duration = duration * 2
         num_ticks = int(duration / self.frame_time_ms / 4)
-        fl_path_quad = [[0.0, 0.0, 0.0] for _ in range(num_ticks * 4)]
-
-        for stage_id in range(stages):
-            for tick_cnt in range(num_ticks):
-                interp_id = stage_id * num_ticks + tick_cnt
-                if stage_id == 0:
-                    fl_path_quad[interp_id][0] = (
-                        abs(self.amplitudeY) * sin(pi * tick_cnt / num_ticks) * self.walk_lift_x_scale
-                    )
-                    fl_path_quad[interp_id][1] = (
-                        -self.amplitudeX * cos(pi * tick_cnt / num_ticks) * self.walk_lift_y_scale
-                    )
-                    fl_path_quad[interp_id][2] = (
-                        abs(self.amplitudeZ) * sin(pi * tick_cnt / num_ticks) * self.walk_lift_z_scale
-                    )
-                elif stage_id in (1, 2, 3):
-                    fl_path_quad[interp_id][0] = 0.0
-                    fl_path_quad[interp_id][1] = (
-                        self.amplitudeX
-                        - self.amplitudeX * 2 * ((stage_id - 1) * num_ticks + tick_cnt) / (3 * num_ticks)
-                    ) * self.walk_stance_y_scale
-                    fl_path_quad[interp_id][2] = 0.0
-
-        def right_rotate_path(path, rotation_num):
-            return path[(len(path) - rotation_num) :] + path[: (len(path) - rotation_num)]
-
-        from copy import deepcopy
-
-        fr_path_quad = deepcopy(right_rotate_path(fl_path_quad, num_ticks * 2))
-        br_path_quad = deepcopy(right_rotate_path(fl_path_quad, num_ticks * 1))
-        bl_path_quad = deepcopy(right_rotate_path(fl_path_quad, num_ticks * 3))
+        cos_tab, sin_tab = self._trig(num_ticks)
+        fl_path_quad = np.zeros((num_ticks * 4, 3))
+        # stage 0 摆动段
+        fl_path_quad[:num_ticks, 0] = abs(self.amplitudeY) * sin_tab * self.walk_lift_x_scale
+        fl_path_quad[:num_ticks, 1] = -self.amplitudeX * cos_tab * self.walk_lift_y_scale
+        fl_path_quad[:num_ticks, 2] = abs(self.amplitudeZ) * sin_tab * self.walk_lift_z_scale
+        # stage 1~3 支撑段：Y 线性回拖
+        stance = np.arange(3 * num_ticks)
+        fl_path_quad[num_ticks:, 1] = (
+            self.amplitudeX - self.amplitudeX * 2 * stance / (3 * num_ticks)
+        ) * self.walk_stance_y_scale
+
+        fr_path_quad = np.roll(fl_path_quad, num_ticks * 2, axis=0)
+        br_path_quad = np.roll(fl_path_quad, num_ticks * 1, axis=0)
+        bl_path_quad = np.roll(fl_path_quad, num_ticks * 3, axis=0)
 
         # 抬腿阶段“向外扩”需要左右镜像：右侧腿(+X)，左侧腿(-X)
-        for p in fl_path_quad:  # FL
-            p[0] = -p[0]
-        for p in bl_path_quad:  # BL
-            p[0] = -p[0]
+        fl_path_quad[:, 0] = -fl_path_quad[:, 0]  # FL
+        bl_path_quad[:, 0] = -bl_path_quad[:, 0]  # BL
 
         return self._formated_path_status(fr_path_quad, fl_path_quad, bl_path_quad, br_path_quad, move_status)
 
@@ -172,31 +164,20 @@ class QuadGait:
         if gait_speed != 0:
             duration = duration * 2
         num_ticks = int(duration / self.frame_time_ms / 4)
-        fl_path_quad = [[0.0, 0.0, 0.0] for _ in range(num_ticks * 4)]
-
-        for stage_id in range(stages):
-            for tick_cnt in range(num_ticks):
-                interp_id = stage_id * num_ticks + tick_cnt
-                if stage_id == 0:
-                    fl_path_quad[interp_id][0] = 0.0
-                    fl_path_quad[interp_id][1] = -self.amplitudeX * cos(pi * tick_cnt / num_ticks) * 1.2
-                    fl_path_quad[interp_id][2] = abs(self.amplitudeZ) * sin(pi * tick_cnt / num_ticks)
-                elif stage_id in (1, 2, 3):
-                    fl_path_quad[interp_id][0] = 0.0
-                    fl_path_quad[interp_id][1] = (
-                        self.amplitudeX
-                        - self.amplitudeX * 2 * ((stage_id - 1) * num_ticks + tick_cnt) / (3 * num_ticks)
-                    ) * 1.2
-                    fl_path_quad[interp_id][2] = 0.0
-
-        def right_rotate_path(path, rotation_num):
-            return path[(len(path) - rotation_num) :] + path[: (len(path) - rotation_num)]
-
-        from copy import deepcopy
-
-        fr_path_quad = deepcopy(right_rotate_path(fl_path_quad, num_ticks * 1))
-        br_path_quad = deepcopy(right_rotate_path(fl_path_quad, num_ticks * 2))
-        bl_path_quad = deepcopy(right_rotate_path(fl_path_quad, num_ticks * 3))
+        cos_tab, sin_tab = self._trig(num_ticks)
+        fl_path_quad = np.zeros((num_ticks * 4, 3))
+        # stage 0 摆动段
+        fl_path_quad[:num_ticks, 1] = -self.amplitudeX * cos_tab * 1.2
+        fl_path_quad[:num_ticks, 2] = abs(self.amplitudeZ) * sin_tab
+        # stage 1~3 支撑段：Y 线性回拖
+        stance = np.arange(3 * num_ticks)
+        fl_path_quad[num_ticks:, 1] = (
+            self.amplitudeX - self.amplitudeX * 2 * stance / (3 * num_ticks)
+        ) * 1.2
+
+        fr_path_quad = np.roll(fl_path_quad, num_ticks * 1, axis=0)
+        br_path_quad = np.roll(fl_path_quad, num_ticks * 2, axis=0)
+        bl_path_quad = np.roll(fl_path_quad, num_ticks * 3, axis=0)
 
         return self._formated_path_status(fr_path_quad, fl_path_quad, bl_path_quad, br_path_quad, move_status)
 
@@ -206,62 +187,33 @@ class QuadGait:
         if gait_speed != 0:
             duration = duration * 2
         num_ticks = int(duration / self.frame_time_ms / 6)
-        fr_path_quad = [[0.0, 0.0, 0.0] for _ in range(num_ticks * 6)]
-        bl_path_quad = [[0.0, 0.0, 0.0] for _ in range(num_ticks * 6)]
-
-        for stage_id in range(stages):
-            for tick_cnt in range(num_ticks):
-                interp_id = stage_id * num_ticks + tick_cnt
-                if stage_id == 0:
-                    fr_path_quad[interp_id][0] = 0.0
-                    fr_path_quad[interp_id][1] = -self.amplitudeX * cos(pi * tick_cnt / num_ticks) * 2.5
-                    fr_path_quad[interp_id][2] = abs(self.amplitudeZ) * sin(pi * tick_cnt / num_ticks) * 1.0
-                    bl_path_quad[interp_id][0] = 0.0
-                    bl_path_quad[interp_id][1] = 0.0
-                    bl_path_quad[interp_id][2] = 0.0
-                elif stage_id == 1:
-                    fr_path_quad[interp_id][0] = 0.0
-                    fr_path_quad[interp_id][1] = self.amplitudeX * cos(pi / 2 * tick_cnt / num_ticks) * 2.5
-                    fr_path_quad[interp_id][2] = 0.0
-                    bl_path_quad[interp_id][0] = 0.0
-                    bl_path_quad[interp_id][1] = -self.amplitudeX * sin(pi / 2 * tick_cnt / num_ticks) * 2.5
-                    bl_path_quad[interp_id][2] = 0.0
-                elif stage_id == 2:
-                    fr_path_quad[interp_id][0] = 0.0
-                    fr_path_quad[interp_id][1] = 0.0
-                    fr_path_quad[interp_id][2] = 0.0
-                    bl_path_quad[interp_id][0] = 0.0
-                    bl_path_quad[interp_id][1] = -self.amplitudeX * cos(pi * tick_cnt / num_ticks) * 2.5
-                    bl_path_quad[interp_id][2] = abs(self.amplitudeZ) * sin(pi * tick_cnt / num_ticks) * 1.0
-                elif stage_id == 3:
-                    fr_path_quad[interp_id][0] = 0.0
-                    fr_path_quad[interp_id][1] = 0.0
-                    fr_path_quad[interp_id][2] = 0.0
-                    bl_path_quad[interp_id][0] = 0.0
-                    bl_path_quad[interp_id][1] = self.amplitudeX * 2.5
-                    bl_path_quad[interp_id][2] = 0.0
-                elif stage_id == 4:
-                    fr_path_quad[interp_id][0] = 0.0
-                    fr_path_quad[interp_id][1] = -self.amplitudeX * sin(pi / 2 * tick_cnt / num_ticks) * 2.5
-                    fr_path_quad[interp_id][2] = 0.0
-                    bl_path_quad[interp_id][0] = 0.0
-                    bl_path_quad[interp_id][1] = self.amplitudeX * cos(pi / 2 * tick_cnt / num_ticks) * 2.5
-                    bl_path_quad[interp_id][2] = 0.0
-                elif stage_id == 5:
-                    fr_path_quad[interp_id][0] = 0.0
-                    fr_path_quad[interp_id][1] = -self.amplitudeX * 2.5
-                    fr_path_quad[interp_id][2] = 0.0
-                    bl_path_quad[interp_id][0] = 0.0
-                    bl_path_quad[interp_id][1] = 0.0
-                    bl_path_quad[interp_id][2] = 0.0
-
-        def left_rotate_path(path, rotation_num):
-            return path[rotation_num:] + path[:rotation_num]
-
-        from copy import deepcopy
-
-        fl_path_quad = deepcopy(left_rotate_path(fr_path_quad, int(len(fr_path_quad) / 2)))
-        br_path_quad = deepcopy(left_rotate_path(bl_path_quad, int(len(bl_path_quad) / 2)))
+        n = num_ticks
+        cos_tab, sin_tab = self._trig(n)
+        # 半相位（pi/2*k/n）即 2n 点表的前半段
+        cos_half, sin_half = (t[:n] for t in self._trig(2 * n))
+        fr_path_quad = np.zeros((n * 6, 3))
+        bl_path_quad = np.zeros((n * 6, 3))
+
+        # stage 0：FR 摆动，BL 静止
+        fr_path_quad[0 : n, 1] = -self.amplitudeX * cos_tab * 2.5
+        fr_path_quad[0 : n, 2] = abs(self.amplitudeZ) * sin_tab * 1.0
+        # stage 1：FR/BL 同步回拖
+        fr_path_quad[n : 2 * n, 1] = self.amplitudeX * cos_half * 2.5
+        bl_path_quad[n : 2 * n, 1] = -self.amplitudeX * sin_half * 2.5
+        # stage 2：BL 摆动
+        bl_path_quad[2 * n : 3 * n, 1] = -self.amplitudeX * cos_tab * 2.5
+        bl_path_quad[2 * n : 3 * n, 2] = abs(self.amplitudeZ) * sin_tab * 1.0
+        # stage 3：BL 前伸保持
+        bl_path_quad[3 * n : 4 * n, 1] = self.amplitudeX * 2.5
+        # stage 4：FR/BL 同步回拖
+        fr_path_quad[4 * n : 5 * n, 1] = -self.amplitudeX * sin_half * 2.5
+        bl_path_quad[4 * n : 5 * n, 1] = self.amplitudeX * cos_half * 2.5
+        # stage 5：FR 后伸保持
+        fr_path_quad[5 * n : 6 * n, 1] = -self.amplitudeX * 2.5
+
+        # 左移半周期（np.roll 负偏移即左旋）
+        fl_path_quad = np.roll(fr_path_quad, -(n * 3), axis=0)
+        br_path_quad = np.roll(bl_path_quad, -(n * 3), axis=0)
 
         return self._formated_path_status(fr_path_quad, fl_path_quad, bl_path_quad, br_path_quad, move_status)
 
@@ -23,7 +23,7 @@ def path_generator():
         pitch = pitch_angle * math.sin(2 * t)
         yaw = yaw_angle * math.sin(t)
 
-        m = get_rotate_z_matrix(yaw) * get_rotate_y_matrix(pitch) * get_rotate_x_matrix(roll)
+        m = get_rotate_z_matrix(yaw) @ get_rotate_y_matrix(pitch) @ get_rotate_x_matrix(roll)
         m[0, 3] = x_sway * math.sin(t)
         m[1, 3] = y_sway * math.sin(2 * t)
         m[2, 3] = z_bounce * (1 - math.cos(2 * t)) / 2
@@ -63,7 +63,7 @@ def semicircle2_generator(steps, y_radius, z_radius, x_radius, reverse=False):
 
 def get_rotate_x_matrix(angle):
     angle = angle * pi / 180
-    return np.matrix([
+    return np.array([
         [1, 0, 0, 0],
         [0, math.cos(angle), -math.sin(angle), 0],
         [0, math.sin(angle), math.cos(angle), 0],
@@ -72,7 +72,7 @@ def get_rotate_x_matrix(angle):
 
 def get_rotate_y_matrix(angle):
     angle = angle * pi / 180
-    return np.matrix([
+    return np.array([
         [math.cos(angle), 0, math.sin(angle), 0],
         [0, 1, 0, 0],
         [-math.sin(angle), 0, math.cos(angle), 0],
@@ -81,7 +81,7 @@ def get_rotate_y_matrix(angle):
 
 def get_rotate_z_matrix(angle):
     angle = angle * pi / 180
-    return np.matrix([
+    return np.array([
         [math.cos(angle), -math.sin(angle), 0, 0],
         [math.sin(angle), math.cos(angle), 0, 0],
         [0, 0, 1, 0],
@@ -89,29 +89,47 @@ def get_rotate_z_matrix(angle):
     ])
 
 def matrix_mul(m, pt):
+    # 旋转矩阵已是普通 ndarray，矩阵乘用 @；列向量保持 (4,1) 二维形状，
+    # 点积顺序与原 np.matrix 乘法完全一致
     ptx = list(pt) + [1]
-    return list((m * np.matrix(ptx).T).T.flat)[:-1]
+    return list((m @ np.array([ptx]).T).T.flat)[:-1]
 
 def point_rotate_x(pt, angle):
     ptx = list(pt) + [1]
-    return list((get_rotate_x_matrix(angle) * np.matrix(ptx).T).T.flat)[:-1]
+    return list((get_rotate_x_matrix(angle) @ np.array([ptx]).T).T.flat)[:-1]
 
 def point_rotate_y(pt, angle):
     ptx = list(pt) + [1]
-    return list((get_rotate_y_matrix(angle) * np.matrix(ptx).T).T.flat)[:-1]
+    return list((get_rotate_y_matrix(angle) @ np.array([ptx]).T).T.flat)[:-1]
 
 def point_rotate_z(pt, angle):
-    ptx = list(pt) + [1]
-    return list((get_rotate_z_matrix(angle) * np.matrix(ptx).T).T.flat)[:-1]
+    # Z 轴旋转只动 x/y 两个分量，直接展开为 4 乘 2 加，
+    # 省掉齐次矩阵构造和 4x4 矩阵-向量乘
+    angle = angle * pi / 180
+    c = math.cos(angle)
+    s = math.sin(angle)
+    x, y, z = pt[0], pt[1], pt[2]
+    # 末尾 + 0.0 复刻原齐次乘法里 0*z / 0*1 两项把 -0.0 归一成 +0.0 的效果，
+    # 保证生成文件与旧实现逐字节一致
+    return [x*c - y*s + 0.0, x*s + y*c + 0.0, z + 0.0]
 
 def path_rotate_x(path, angle):
-    return [point_rotate_x(p, angle) for p in path]
+    # 整条路径共用同一个旋转角：矩阵只构造一次，逐点乘法与 point_rotate_x 完全一致
+    m = get_rotate_x_matrix(angle)
+    return [list((m @ np.array([list(p) + [1]]).T).T.flat)[:-1] for p in path]
 
 def path_rotate_y(path, angle):
-    return [point_rotate_y(p, angle) for p in path]
+    m = get_rotate_y_matrix(angle)
+    return [list((m @ np.array([list(p) + [1]]).T).T.flat)[:-1] for p in path]
 
 def path_rotate_z(path, angle):
-    return [point_rotate_z(p, angle) for p in path]
+    # cos/sin 每条路径只算一次（turnleft/turnright 各旋转 6 条路径，
+    # 原先每个点重复一遍角度换算和两次 libm 调用）；
+    # 逐点表达式与 point_rotate_z 一致，末尾 + 0.0 同样保留 -0.0 归一
+    rad = angle * pi / 180
+    c = math.cos(rad)
+    s = math.sin(rad)
+    return [[p[0]*c - p[1]*s + 0.0, p[0]*s + p[1]*c + 0.0, p[2] + 0.0] for p in path]
 
 if __name__ == '__main__':
     pt = [0, 1, 0]
@@ -19,7 +19,7 @@ def path_generator():
         x = xy_radius * math.cos(i*step_angle)
         y = xy_radius * math.sin(i*step_angle)
 
-        m = get_rotate_y_matrix(math.atan2(x, z_lift)*180/pi) * get_rotate_x_matrix(math.atan2(y, z_lift)*180/pi)
+        m = get_rotate_y_matrix(math.atan2(x, z_lift)*180/pi) @ get_rotate_x_matrix(math.atan2(y, z_lift)*180/pi)
         result.append(m)
 
     return result, "matrix", 50, range(g_steps)
\ No newline at end of file
@@ -3,10 +3,15 @@ from __future__ import annotations
 import argparse
 import os
 import sys
+from pathlib import Path
 from typing import Optional
 
 from models import HexapodModel, QuadModel
 
+# 仓库根目录在导入期解析一次（__file__ 已是绝对路径语义，免去每次 getcwd）
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+_GENERATED_DIR = _REPO_ROOT / "firmware" / "src" / "generated"
+
 
 def build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="pathTool: generate robot paths")
@@ -35,17 +40,14 @@ def build_arg_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def resolve_default_out_path(robot: str, script_dir: str) -> str:
+def resolve_default_out_path(robot: str) -> str:
     # 默认输出：直接落到固件目录，避免在仓库里出现多份“生成文件副本”
-    repo_root = os.path.abspath(os.path.join(script_dir, "..", "..", ".."))
-    generated_dir = os.path.join(repo_root, "firmware", "src", "generated")
-    if robot == "quad":
-        return os.path.join(generated_dir, "movement_table_quad.h")
-    return os.path.join(generated_dir, "movement_table.h")
+    name = "movement_table_quad.h" if robot == "quad" else "movement_table.h"
+    return str(_GENERATED_DIR / name)
 
 
 def ensure_out_dir(out_path: str) -> None:
-    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    Path(out_path).resolve().parent.mkdir(parents=True, exist_ok=True)
 
 
 def run_hexapod(path_dir: str, out_path: str, script_dir: str) -> None:
@@ -66,16 +68,23 @@ def run_hexapod(path_dir: str, out_path: str, script_dir: str) -> None:
         print("There were errors, exit...")
         sys.exit(1)
 
+    # 先在内存拼好整个文件，最后一次 write：避免每个 print 各走一遍 IO/编码层；
+    # body 与 def 在同一次遍历里生成，results 只走一遍
+    bodies, defs = [], []
+    for path, data in results.items():
+        bodies.append(model.generate_c_body(path, data))
+        defs.append(model.generate_c_def(path))
+    out_lines = [
+        "//",
+        "// This file is generated, dont directly modify content...",
+        "//",
+        "namespace {",
+    ]
+    out_lines.extend(bodies)
+    out_lines.append("}\n")
+    out_lines.extend(defs)
     with open(out_path, "w") as f:
-        print("//", file=f)
-        print("// This file is generated, dont directly modify content...", file=f)
-        print("//", file=f)
-        print("namespace {", file=f)
-        for path, data in results.items():
-            print(model.generate_c_body(path, data), file=f)
-        print("}\n", file=f)
-        for path in results:
-            print(model.generate_c_def(path), file=f)
+        f.write("\n".join(out_lines) + "\n")
 
     print("Hexapod result written to {}".format(os.path.abspath(out_path)))
 
@@ -85,16 +94,23 @@ def run_quad(out_path: str) -> None:
     model = QuadModel()
     results = model.generate_all_gaits()
 
+    # 先在内存拼好整个文件，最后一次 write：避免每个 print 各走一遍 IO/编码层；
+    # body 与 def 在同一次遍历里生成，results 只走一遍
+    bodies, defs = [], []
+    for path, data in results.items():
+        bodies.append(model.generate_c_body(path, data))
+        defs.append(model.generate_c_def(path))
+    out_lines = [
+        "//",
+        "// This file is generated for Quad robot, dont directly modify content...",
+        "//",
+        "namespace quadruped {",
+    ]
+    out_lines.extend(bodies)
+    out_lines.extend(defs)
+    out_lines.append("}\n")
     with open(out_path, "w") as f:
-        print("//", file=f)
-        print("// This file is generated for Quad robot, dont directly modify content...", file=f)
-        print("//", file=f)
-        print("namespace quadruped {", file=f)
-        for path, data in results.items():
-            print(model.generate_c_body(path, data), file=f)
-        for path in results:
-            print(model.generate_c_def(path), file=f)
-        print("}\n", file=f)
+        f.write("\n".join(out_lines) + "\n")
 
     print("Quad result written to {}".format(os.path.abspath(out_path)))
 
@@ -105,7 +121,7 @@ def main(argv: Optional[list[str]] = None) -> int:
 
     script_dir = os.path.dirname(os.path.abspath(__file__))
     if args.out_path is None:
-        args.out_path = resolve_default_out_path(args.robot, script_dir)
+        args.out_path = resolve_default_out_path(args.robot)
     ensure_out_dir(args.out_path)
 
     if args.robot == "hexapod":